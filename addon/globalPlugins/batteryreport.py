@@ -4,14 +4,24 @@ import json
 import threading
 import subprocess
 import locale
+import mmap
+import struct
+import platform
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
 from datetime import datetime
 from html import unescape
 
 import wx
 import gui
 import ui
+import config
 import addonHandler
 import globalPluginHandler
+from gui import guiHelper, nvdaControls
+from gui.settingsDialogs import NVDASettingsDialog, SettingsPanel
 from scriptHandler import script
 
 addonHandler.initTranslation()
@@ -19,6 +29,14 @@ addonHandler.initTranslation()
 ADDON_DIR = os.path.dirname(__file__)
 REPORTS_DIR = os.path.join(ADDON_DIR, "battery_reports")
 HISTORY_FILE = os.path.join(ADDON_DIR, "battery_history.json")
+SNAPSHOT_FILE = os.path.join(ADDON_DIR, "battery_history.bin")
+SUMMARY_FILE = os.path.join(ADDON_DIR, "battery_summary.json")
+HISTORY_LIMIT = 100
+CONFIG_SECTION = "batteryReport"
+config.conf.spec[CONFIG_SECTION] = {
+    "summaryMaxAgeHours": "integer(default=24, min=0, max=720)",
+    "sampleIntervalSeconds": "integer(default=10, min=1, max=3600)",
+}
 DIALOG_TITLE = _("NVDA Battery Report")
 EMPTY_HISTORY_MSG = _("No battery reports found.")
 os.makedirs(REPORTS_DIR, exist_ok=True)
@@ -54,6 +72,10 @@ def generate_battery_report():
         raise FileNotFoundError(_("powercfg.exe not found."))
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     out_path = os.path.join(REPORTS_DIR, f"battery_report_{ts}.html")
+    n = 1
+    while os.path.exists(out_path):
+        out_path = os.path.join(REPORTS_DIR, f"battery_report_{ts}_{n}.html")
+        n += 1
     cmd = [POWERCFG, "/batteryreport", "/output", out_path]
     p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, shell=False)
     _, stderr = p.communicate()
@@ -74,19 +96,153 @@ def _collapse(s):
     return re.sub(r"\s+", " ", unescape(s), flags=re.S).strip()
 
 
-def _find_table_by_header(html, header_text):
-    pat = rf"<h2[^>]*>\s*{re.escape(header_text)}\s*</h2>\s*(?:<(?:div|canvas)[^>]*>.*?</(?:div|canvas)>\s*)*<table[^>]*>(.*?)</table>"
-    m = re.search(pat, html, flags=re.I | re.S)
-    return m.group(1) if m else ""
-
-
-def _text_in_td_after(label, html):
-    pat = r"<t[dh][^>]*>\s*(?:<span[^>]*>)?\s*" + re.escape(label) + r"\s*(?:</span>)?\s*</t[dh]>\s*<t[dh][^>]*>(.*?)</t[dh]>"
-    m = re.search(pat, html, flags=re.I | re.S)
-    if not m:
-        return ""
-    val = re.sub(r"<[^>]+>", "", m.group(1), flags=re.S)
-    return _collapse(val)
+# Only the English strings come from real powercfg reports; the translations
+# have not been checked against localized ones.
+_HEADING_TEXTS = {
+    "en": {
+        "report": "Battery report",
+        "installed": "Installed batteries",
+        "recent_usage": "Recent usage",
+        "battery_usage": "Battery usage",
+        "usage_history": "Usage history",
+        "capacity_history": "Battery capacity history",
+        "life_estimates": "Battery life estimates",
+    },
+    "pt_BR": {
+        "report": "Relatório de bateria",
+        "installed": "Baterias instaladas",
+        "recent_usage": "Uso recente",
+        "battery_usage": "Uso da bateria",
+        "usage_history": "Histórico de uso",
+        "capacity_history": "Histórico de capacidade da bateria",
+        "life_estimates": "Estimativas de duração da bateria",
+    },
+    "es": {
+        "report": "Informe de batería",
+        "installed": "Baterías instaladas",
+        "recent_usage": "Uso reciente",
+        "battery_usage": "Uso de la batería",
+        "usage_history": "Historial de uso",
+        "capacity_history": "Historial de capacidad de la batería",
+        "life_estimates": "Estimaciones de duración de la batería",
+    },
+    "fr": {
+        "report": "Rapport de batterie",
+        "installed": "Batteries installées",
+        "recent_usage": "Utilisation récente",
+        "battery_usage": "Utilisation de la batterie",
+        "usage_history": "Historique d'utilisation",
+        "capacity_history": "Historique de capacité de la batterie",
+        "life_estimates": "Estimations de l'autonomie de la batterie",
+    },
+    "it": {
+        "report": "Rapporto batteria",
+        "installed": "Batterie installate",
+        "recent_usage": "Utilizzo recente",
+        "battery_usage": "Utilizzo batteria",
+        "usage_history": "Cronologia utilizzo",
+        "capacity_history": "Cronologia capacità batteria",
+        "life_estimates": "Stime durata batteria",
+    },
+}
+
+_LABEL_TEXTS = {
+    "pt_BR": {
+        "COMPUTER NAME": "NOME DO COMPUTADOR", "SYSTEM PRODUCT NAME": "NOME DO PRODUTO DO SISTEMA",
+        "OS BUILD": "COMPILAÇÃO DO SO", "PLATFORM ROLE": "FUNÇÃO DA PLATAFORMA", "CONNECTED STANDBY": "ESPERA CONECTADA",
+        "REPORT TIME": "HORA DO RELATÓRIO", "NAME": "NOME", "MANUFACTURER": "FABRICANTE", "SERIAL NUMBER": "NÚMERO DE SÉRIE",
+        "CHEMISTRY": "QUÍMICA", "DESIGN CAPACITY": "CAPACIDADE DE DESIGN", "FULL CHARGE CAPACITY": "CAPACIDADE DE CARGA TOTAL",
+        "CYCLE COUNT": "CONTAGEM DE CICLOS", "START TIME": "HORA DE INÍCIO", "STATE": "ESTADO", "SOURCE": "ORIGEM",
+        "CAPACITY REMAINING": "CAPACIDADE RESTANTE", "DURATION": "DURAÇÃO", "ENERGY DRAINED": "ENERGIA DRENADA",
+        "PERIOD": "PERÍODO", "ACTIVE": "ATIVO", "AT FULL CHARGE": "EM CARGA TOTAL", "AT DESIGN CAPACITY": "NA CAPACIDADE DE DESIGN",
+        "BATTERY DURATION": "DURAÇÃO DA BATERIA", "AC DURATION": "DURAÇÃO DA CA",
+        "BATTERY": "BATERIA", "AC": "CA",
+    },
+    "es": {
+        "COMPUTER NAME": "NOMBRE DEL EQUIPO", "SYSTEM PRODUCT NAME": "NOMBRE DEL PRODUCTO DEL SISTEMA",
+        "OS BUILD": "COMPILACIÓN DEL SO", "PLATFORM ROLE": "ROL DE LA PLATAFORMA", "CONNECTED STANDBY": "ESPERA CONECTADA",
+        "REPORT TIME": "HORA DEL INFORME", "NAME": "NOMBRE", "MANUFACTURER": "FABRICANTE", "SERIAL NUMBER": "NÚMERO DE SERIE",
+        "CHEMISTRY": "QUÍMICA", "DESIGN CAPACITY": "CAPACIDAD DE DISEÑO", "FULL CHARGE CAPACITY": "CAPACIDAD DE CARGA COMPLETA",
+        "CYCLE COUNT": "NÚMERO DE CICLOS", "START TIME": "HORA DE INICIO", "STATE": "ESTADO", "SOURCE": "ORIGEN",
+        "CAPACITY REMAINING": "CAPACIDAD RESTANTE", "DURATION": "DURACIÓN", "ENERGY DRAINED": "ENERGÍA CONSUMIDA",
+        "PERIOD": "PERÍODO", "ACTIVE": "ACTIVO", "AT FULL CHARGE": "CON CARGA COMPLETA", "AT DESIGN CAPACITY": "CON CAPACIDAD DE DISEÑO",
+        "BATTERY DURATION": "DURACIÓN DE LA BATERÍA", "AC DURATION": "DURACIÓN DE CA",
+        "BATTERY": "BATERÍA", "AC": "CA",
+    },
+    "fr": {
+        "COMPUTER NAME": "NOM DE L'ORDINATEUR", "SYSTEM PRODUCT NAME": "NOM DU PRODUIT SYSTÈME",
+        "OS BUILD": "BUILD DU SE", "PLATFORM ROLE": "RÔLE DE LA PLATEFORME", "CONNECTED STANDBY": "VEILLE CONNECTÉE",
+        "REPORT TIME": "HEURE DU RAPPORT", "NAME": "NOM", "MANUFACTURER": "FABRICANT", "SERIAL NUMBER": "NUMÉRO DE SÉRIE",
+        "CHEMISTRY": "COMPOSITION CHIMIQUE", "DESIGN CAPACITY": "CAPACITÉ NOMINALE", "FULL CHARGE CAPACITY": "CAPACITÉ DE CHARGE COMPLÈTE",
+        "CYCLE COUNT": "NOMBRE DE CYCLES", "START TIME": "HEURE DE DÉBUT", "STATE": "ÉTAT", "SOURCE": "SOURCE",
+        "CAPACITY REMAINING": "CAPACITÉ RESTANTE", "DURATION": "DURÉE", "ENERGY DRAINED": "ÉNERGIE CONSOMMÉE",
+        "PERIOD": "PÉRIODE", "ACTIVE": "ACTIF", "AT FULL CHARGE": "À PLEINE CHARGE", "AT DESIGN CAPACITY": "À LA CAPACITÉ NOMINALE",
+        "BATTERY DURATION": "DURÉE SUR BATTERIE", "AC DURATION": "DURÉE SUR SECTEUR",
+        "BATTERY": "BATTERIE", "AC": "SECTEUR",
+    },
+    "it": {
+        "COMPUTER NAME": "NOME COMPUTER", "SYSTEM PRODUCT NAME": "NOME PRODOTTO DI SISTEMA",
+        "OS BUILD": "BUILD SO", "PLATFORM ROLE": "RUOLO PIATTAFORMA", "CONNECTED STANDBY": "STANDBY CONNESSO",
+        "REPORT TIME": "ORA REPORT", "NAME": "NOME", "MANUFACTURER": "PRODUTTORE", "SERIAL NUMBER": "NUMERO DI SERIE",
+        "CHEMISTRY": "COMPOSIZIONE CHIMICA", "DESIGN CAPACITY": "CAPACITÀ PROGETTUALE", "FULL CHARGE CAPACITY": "CAPACITÀ A CARICA COMPLETA",
+        "CYCLE COUNT": "CONTEGGIO CICLI", "START TIME": "ORA INIZIO", "STATE": "STATO", "SOURCE": "ORIGINE",
+        "CAPACITY REMAINING": "CAPACITÀ RIMANENTE", "DURATION": "DURATA", "ENERGY DRAINED": "ENERGIA CONSUMATA",
+        "PERIOD": "PERIODO", "ACTIVE": "ATTIVO", "AT FULL CHARGE": "A CARICA COMPLETA", "AT DESIGN CAPACITY": "ALLA CAPACITÀ PROGETTUALE",
+        "BATTERY DURATION": "DURATA BATTERIA", "AC DURATION": "DURATA CA",
+        "BATTERY": "BATTERIA", "AC": "CA",
+    },
+}
+
+_HEADER_FIELDS = {
+    "COMPUTER NAME": "Computer name",
+    "SYSTEM PRODUCT NAME": "System product name",
+    "BIOS": "BIOS",
+    "OS BUILD": "OS build",
+    "PLATFORM ROLE": "Platform role",
+    "CONNECTED STANDBY": "Connected standby",
+    "REPORT TIME": "Report time",
+}
+
+_INSTALLED_FIELDS = {
+    "NAME": "Name",
+    "MANUFACTURER": "Manufacturer",
+    "SERIAL NUMBER": "Serial number",
+    "CHEMISTRY": "Chemistry",
+    "DESIGN CAPACITY": "Design capacity",
+    "FULL CHARGE CAPACITY": "Full charge capacity",
+    "CYCLE COUNT": "Cycle count",
+}
+
+
+def _norm_label(s):
+    return (s or "").strip().rstrip(":").strip().upper()
+
+
+_HEADING_LOOKUP = {_norm_label(text): key for texts in _HEADING_TEXTS.values() for key, text in texts.items()}
+_LABEL_LOOKUP = {label: label for label in set(_HEADER_FIELDS) | set(_INSTALLED_FIELDS) | {lab for texts in _LABEL_TEXTS.values() for lab in texts}}
+_LABEL_LOOKUP.update({_norm_label(text): label for texts in _LABEL_TEXTS.values() for label, text in texts.items()})
+_SECTION_RE = re.compile(r"<h([12])[^>]*>((?:(?!<h[12]).)*?)</h\1>\s*(?:<(?:div|canvas)[^>]*>(?:(?!<h[12]).)*?</(?:div|canvas)>\s*)*<table[^>]*>(.*?)</table>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>", re.S)
+
+
+def _canonical_row(row):
+    labels = [_LABEL_LOOKUP.get(_norm_label(c)) for c in row]
+    if all(lab or not c for lab, c in zip(labels, row)) and any(labels):
+        return [lab or c for lab, c in zip(labels, row)]
+    return row
+
+
+def _label_columns(rows, fields):
+    columns = []
+    for r in rows:
+        field = fields.get(_LABEL_LOOKUP.get(_norm_label(r[0]), ""))
+        if not field:
+            continue
+        for i, val in enumerate(r[1:]):
+            while len(columns) <= i:
+                columns.append({f: "" for f in fields.values()})
+            columns[i][field] = val
+    return columns
 
 
 def _table_rows(html_table_inner):
@@ -139,6 +295,29 @@ def _fmt_dt_local(d):
         return d.strftime("%d/%m/%Y %H:%M:%S")
 
 
+def _key_dt(value, kind):
+    if not value:
+        return None
+    if kind == "period":
+        m = _PERIOD_RE.match(value)
+        if m:
+            return _parse_dt(m.group(2))
+    return _parse_dt(value)
+
+
+def _parse_user_date(s):
+    s = (s or "").strip()
+    if not s:
+        return None
+    dt = _parse_dt(s)
+    if dt:
+        return dt
+    try:
+        return datetime.strptime(s, "%x")
+    except Exception:
+        return None
+
+
 def _localize_cell(label, value):
     if not value:
         return value
@@ -159,52 +338,49 @@ def _localize_cell(label, value):
     return _fmt_dt_local(dt) if dt else value
 
 
-def parse_battery_report(html):
-    if not html:
-        return {}
-    raw = _collapse(html)
-    m_head = re.search(r"<h1[^>]*>\s*Battery report\s*</h1>\s*<table[^>]*>(.*?)</table>", raw, flags=re.I | re.S)
-    head_tbl = m_head.group(1) if m_head else ""
-    header = {
-        "Computer name": _text_in_td_after("COMPUTER NAME", head_tbl),
-        "System product name": _text_in_td_after("SYSTEM PRODUCT NAME", head_tbl),
-        "BIOS": _text_in_td_after("BIOS", head_tbl),
-        "OS build": _text_in_td_after("OS BUILD", head_tbl),
-        "Platform role": _text_in_td_after("PLATFORM ROLE", head_tbl),
-        "Connected standby": _text_in_td_after("CONNECTED STANDBY", head_tbl),
-        "Report time": _text_in_td_after("REPORT TIME", head_tbl),
-    }
-    inst_tbl = _find_table_by_header(raw, "Installed batteries") or ""
-    installed = {
-        "Name": _text_in_td_after("NAME", inst_tbl),
-        "Manufacturer": _text_in_td_after("MANUFACTURER", inst_tbl),
-        "Serial number": _text_in_td_after("SERIAL NUMBER", inst_tbl),
-        "Chemistry": _text_in_td_after("CHEMISTRY", inst_tbl),
-        "Design capacity": _text_in_td_after("DESIGN CAPACITY", inst_tbl),
-        "Full charge capacity": _text_in_td_after("FULL CHARGE CAPACITY", inst_tbl),
-        "Cycle count": _text_in_td_after("CYCLE COUNT", inst_tbl),
-    }
+def _battery_health(installed):
     design_mWh = _to_mWh(installed.get("Design capacity")) if installed.get("Design capacity") else None
     full_mWh = _to_mWh(installed.get("Full charge capacity")) if installed.get("Full charge capacity") else None
     health_pct = round((full_mWh / float(design_mWh)) * 100.0, 2) if (design_mWh and full_mWh) else None
+    return design_mWh, full_mWh, health_pct
 
-    recent_tbl = _find_table_by_header(raw, "Recent usage")
-    usage_tbl = _find_table_by_header(raw, "Battery usage")
-    hist_tbl = _find_table_by_header(raw, "Usage history")
-    cap_tbl = _find_table_by_header(raw, "Battery capacity history")
-    life_tbl = _find_table_by_header(raw, "Battery life estimates")
+
+def parse_battery_report(html):
+    if not html:
+        return {}
+    raw = _collapse(html)
+    tables = {}
+    for m in _SECTION_RE.finditer(raw):
+        key = _HEADING_LOOKUP.get(_norm_label(_TAG_RE.sub("", m.group(2))))
+        if key and key not in tables:
+            tables[key] = _table_rows(m.group(3))
+    header = (_label_columns(tables.get("report", []), _HEADER_FIELDS) or [{f: "" for f in _HEADER_FIELDS.values()}])[0]
+    batteries = []
+    for inst in _label_columns(tables.get("installed", []), _INSTALLED_FIELDS):
+        design_mWh, full_mWh, health_pct = _battery_health(inst)
+        batteries.append({"installed": inst, "design_mWh": design_mWh, "full_mWh": full_mWh, "health_pct": health_pct})
+    installed = batteries[0]["installed"] if batteries else {f: "" for f in _INSTALLED_FIELDS.values()}
+    if len(batteries) <= 1:
+        design_mWh, full_mWh, health_pct = _battery_health(installed)
+    elif all(b["design_mWh"] and b["full_mWh"] for b in batteries):
+        design_mWh = sum(b["design_mWh"] for b in batteries)
+        full_mWh = sum(b["full_mWh"] for b in batteries)
+        health_pct = round((full_mWh / float(design_mWh)) * 100.0, 2)
+    else:
+        design_mWh = full_mWh = health_pct = None
 
     return {
         "header": header,
         "installed": installed,
+        "batteries": batteries,
         "design_mWh": design_mWh,
         "full_mWh": full_mWh,
         "health_pct": health_pct,
-        "recent_usage": _table_rows(recent_tbl),
-        "battery_usage": _table_rows(usage_tbl),
-        "usage_history": _table_rows(hist_tbl),
-        "capacity_history": _table_rows(cap_tbl),
-        "life_estimates": _table_rows(life_tbl),
+        "recent_usage": [_canonical_row(r) for r in tables.get("recent_usage", [])],
+        "battery_usage": [_canonical_row(r) for r in tables.get("battery_usage", [])],
+        "usage_history": [_canonical_row(r) for r in tables.get("usage_history", [])],
+        "capacity_history": [_canonical_row(r) for r in tables.get("capacity_history", [])],
+        "life_estimates": [_canonical_row(r) for r in tables.get("life_estimates", [])],
     }
 
 
@@ -241,7 +417,7 @@ def _upper_set(lst):
     return {(c or "").strip().upper() for c in lst}
 
 
-def _build_items_from_table(rows, expected_headers, label_map=None, date_key_kind=None):
+def _build_items_from_table(rows, expected_headers, label_map=None, date_key_kind=None, legend=""):
     items = []
     header_idx = None
     for i, r in enumerate(rows):
@@ -265,39 +441,846 @@ def _build_items_from_table(rows, expected_headers, label_map=None, date_key_kin
             lab = (label_map.get(h.strip().upper(), h) if label_map else h)
             val = _localize_cell(h, raw_val)
             pairs.append(f"{lab}: {val}" if val else f"{lab}:")
-            if key_dt is None:
-                if date_key_kind == "start":
-                    dt = _parse_dt(raw_val)
-                    if dt:
-                        key_dt = dt
-                elif date_key_kind == "period":
-                    m = _PERIOD_RE.match(raw_val)
-                    if m:
-                        dt = _parse_dt(m.group(2))
-                        if dt:
-                            key_dt = dt
-                    else:
-                        dt = _parse_dt(raw_val)
-                        if dt:
-                            key_dt = dt
-        items.append((key_dt, " | ".join(pairs)))
+            if key_dt is None and date_key_kind:
+                key_dt = _key_dt(raw_val, date_key_kind)
+        line = " | ".join(pairs)
+        items.append((key_dt, line, f"{line}\n\n{legend}"))
     return items
 
 
+_DIFF_TABLES = (
+    ("recent_usage", {"START TIME", "STATE", "SOURCE", "CAPACITY REMAINING"}, _("Recent usage")),
+    ("battery_usage", {"START TIME", "STATE", "DURATION", "ENERGY DRAINED"}, _("Battery usage")),
+    ("capacity_history", {"PERIOD", "FULL CHARGE CAPACITY", "DESIGN CAPACITY"}, _("Capacity history")),
+    ("usage_history", {"PERIOD", "ACTIVE", "CONNECTED STANDBY"}, _("Usage history")),
+    ("life_estimates", {"PERIOD", "ACTIVE", "CONNECTED STANDBY"}, _("Battery life estimates")),
+)
+
+
+def _keyed_rows(rows, expected_headers):
+    keyed = {}
+    for r in rows:
+        if not r or _is_all_nulls(r) or expected_headers & _upper_set(r):
+            continue
+        key = (r[0] or "").strip()
+        if key and key not in keyed:
+            keyed[key] = r
+    return keyed
+
+
+def diff_reports(old, new):
+    def delta(a, b):
+        return (b - a) if (a is not None and b is not None) else None
+
+    old = old or {}; new = new or {}
+    old_cc = _to_mWh((old.get("installed") or {}).get("Cycle count"))
+    new_cc = _to_mWh((new.get("installed") or {}).get("Cycle count"))
+    tables = {}
+    for key, headers, _label in _DIFF_TABLES:
+        before = _keyed_rows(old.get(key, []), headers)
+        after = _keyed_rows(new.get(key, []), headers)
+        tables[key] = {
+            "added": [r for k, r in after.items() if k not in before],
+            "removed": [r for k, r in before.items() if k not in after],
+        }
+    return {
+        "health_pct": delta(old.get("health_pct"), new.get("health_pct")),
+        "full_mWh": delta(old.get("full_mWh"), new.get("full_mWh")),
+        "cycle_count": delta(old_cc, new_cc),
+        "tables": tables,
+    }
+
+
+class SortedIndex:
+    def __init__(self, pairs=()):
+        pairs = sorted(pairs, key=lambda p: p[0])
+        self._keys = [k for k, v in pairs]
+        self._values = [v for k, v in pairs]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, key, value):
+        i = bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._values.insert(i, value)
+
+    def range(self, lo=None, hi=None):
+        i = bisect_left(self._keys, lo) if lo is not None else 0
+        j = bisect_right(self._keys, hi) if hi is not None else len(self._keys)
+        return self._values[i:j]
+
+    def tail(self, n):
+        return self._values[max(0, len(self._values) - n):]
+
+    def copy(self):
+        other = SortedIndex()
+        other._keys = list(self._keys)
+        other._values = list(self._values)
+        return other
+
+
+class HistoryIndex:
+    def __init__(self, items=(), rows=True):
+        self._reports = SortedIndex()
+        self._by_serial = {}
+        self._index_rows = rows
+        self._rows = {key: {} for key, headers, label in _DIFF_TABLES}
+        self._row_index = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item):
+        info = item.get("info") or {}
+        report_dt = _parse_dt((info.get("header") or {}).get("Report time") or "")
+        if report_dt is not None:
+            self._reports.add(report_dt, item)
+            batteries = info.get("batteries") or [{"installed": info.get("installed") or {}}]
+            for serial in {(bat.get("installed", {}).get("Serial number") or "").strip() for bat in batteries}:
+                if serial:
+                    self._by_serial.setdefault(serial, SortedIndex()).add(report_dt, item)
+        if not self._index_rows:
+            return
+        report_dt = report_dt or datetime.min
+        for key, headers, label in _DIFF_TABLES:
+            kind = "period" if "PERIOD" in headers else "start"
+            known = self._rows[key]
+            for row_key, row in _keyed_rows(info.get(key, []), headers).items():
+                dt = _key_dt(row_key, kind)
+                if dt is None:
+                    continue
+                prev = known.get(row_key)
+                if prev is None or prev[1] <= report_dt:
+                    known[row_key] = (dt, report_dt, row)
+            self._row_index.pop(key, None)
+
+    def reports_between(self, start=None, end=None, serial=None):
+        index = self._by_serial.get(serial) if serial else self._reports
+        return index.range(start, end) if index else []
+
+    def previous_report(self, item):
+        info = item.get("info") or {}
+        report_dt = _parse_dt((info.get("header") or {}).get("Report time") or "")
+        if report_dt is None:
+            return None
+        serial = ((info.get("installed") or {}).get("Serial number") or "").strip()
+        for other in reversed(self.reports_between(None, report_dt, serial or None)):
+            if other is not item:
+                return other
+        return None
+
+    def rows_between(self, table, start=None, end=None):
+        index = self._row_index.get(table)
+        if index is None:
+            index = SortedIndex((dt, row) for dt, report_dt, row in self._rows.get(table, {}).values())
+            self._row_index[table] = index
+        return index.range(start, end)
+
+
+_SNAPSHOT_MAGIC = b"NBRC"
+_SNAPSHOT_VERSION = 2
+_SNAPSHOT_HEAD = struct.Struct("<4sHHI")
+_SNAPSHOT_ENTRY = struct.Struct("<16s4sQQ")
+_SNAPSHOT_TABLES = (
+    ("recent_usage", "rc"),
+    ("battery_usage", "bu"),
+    ("usage_history", "uh"),
+    ("capacity_history", "ch"),
+    ("life_estimates", "le"),
+)
+_SNAPSHOT_INFO_KEYS = ("header", "installed", "design_mWh", "full_mWh", "health_pct") + tuple(k for k, short in _SNAPSHOT_TABLES)
+
+
+def write_history_snapshot(items, path):
+    strings = {}
+    def sid(s):
+        s = s or ""
+        i = strings.get(s)
+        if i is None:
+            i = strings[s] = len(strings)
+        return i
+
+    cols = {
+        "r.design": array("q"), "r.full": array("q"), "r.health": array("d"),
+        "r.summary": array("I"), "r.path": array("I"), "r.xitem": array("I"), "r.xinfo": array("I"),
+        "r.meta": array("I"), "m.section": array("B"), "m.key": array("I"), "m.value": array("I"),
+    }
+    for key, short in _SNAPSHOT_TABLES:
+        for name, code in (("report", "I"), ("coff", "I"), ("cells", "I")):
+            cols[f"{short}.{name}"] = array(code)
+        cols[f"{short}.coff"].append(0)
+    cols["r.meta"].append(0)
+    for n, item in enumerate(items):
+        info = item.get("info") or {}
+        header = info.get("header") or {}
+        installed = info.get("installed") or {}
+        cols["r.design"].append(info.get("design_mWh") or -1)
+        cols["r.full"].append(info.get("full_mWh") or -1)
+        hp = info.get("health_pct")
+        cols["r.health"].append(float("nan") if hp is None else hp)
+        cols["r.summary"].append(sid(item.get("summary")))
+        cols["r.path"].append(sid(item.get("path")))
+        for name, extra in (
+            ("r.xitem", {k: v for k, v in item.items() if k not in ("summary", "path", "info")}),
+            ("r.xinfo", {k: v for k, v in info.items() if k not in _SNAPSHOT_INFO_KEYS}),
+        ):
+            cols[name].append(sid(json.dumps(extra, ensure_ascii=False) if extra else ""))
+        for section, d in ((0, header), (1, installed)):
+            for k, v in d.items():
+                cols["m.section"].append(section)
+                cols["m.key"].append(sid(k))
+                cols["m.value"].append(sid(v))
+        cols["r.meta"].append(len(cols["m.key"]))
+        for key, short in _SNAPSHOT_TABLES:
+            cells = cols[f"{short}.cells"]
+            for row in info.get(key, []):
+                cols[f"{short}.report"].append(n)
+                cells.extend(sid(c) for c in row)
+                cols[f"{short}.coff"].append(len(cells))
+    blob = bytearray()
+    offsets = array("Q", [0])
+    for s in strings:
+        blob += s.encode("utf-8")
+        offsets.append(len(blob))
+    cols["s.offsets"] = offsets
+    cols["s.blob"] = array("B", blob)
+
+    names = list(cols)
+    offset = _SNAPSHOT_HEAD.size + _SNAPSHOT_ENTRY.size * len(names)
+    entries = []
+    for name in names:
+        offset = (offset + 7) & ~7
+        col = cols[name]
+        entries.append(_SNAPSHOT_ENTRY.pack(name.encode("ascii"), col.typecode.encode("ascii"), len(col), offset))
+        offset += len(col) * col.itemsize
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_SNAPSHOT_HEAD.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0, len(names)))
+        for e in entries:
+            f.write(e)
+        for name, entry in zip(names, entries):
+            f.write(b"\0" * (_SNAPSHOT_ENTRY.unpack(entry)[3] - f.tell()))
+            f.write(cols[name].tobytes())
+    os.replace(tmp, path)
+
+
+class ColumnarSnapshot:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._buf = None
+        self._views = {}
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._buf = memoryview(self._mm)
+        try:
+            magic, version, _reserved, count = _SNAPSHOT_HEAD.unpack_from(self._mm, 0)
+            if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+                raise ValueError
+            self._dir = {}
+            for i in range(count):
+                name, code, n, offset = _SNAPSHOT_ENTRY.unpack_from(self._mm, _SNAPSHOT_HEAD.size + i * _SNAPSHOT_ENTRY.size)
+                code = code.rstrip(b"\0").decode("ascii")
+                if offset + n * array(code).itemsize > len(self._mm):
+                    raise ValueError
+                self._dir[name.rstrip(b"\0").decode("ascii")] = (code, n, offset)
+        except Exception:
+            self.close()
+            raise ValueError(_("Unsupported battery history snapshot."))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.column("r.summary"))
+
+    def close(self):
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+            self._mm.close()
+            self._file.close()
+
+    def column(self, name):
+        view = self._views.get(name)
+        if view is None:
+            code, n, offset = self._dir[name]
+            view = self._buf[offset:offset + n * array(code).itemsize].cast(code)
+            self._views[name] = view
+        return view
+
+    def string(self, i):
+        offsets = self.column("s.offsets")
+        return self.column("s.blob")[offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+
+    def table_rows(self, key, report):
+        short = dict(_SNAPSHOT_TABLES)[key]
+        owners = self.column(f"{short}.report")
+        coff = self.column(f"{short}.coff")
+        cells = self.column(f"{short}.cells")
+        first = bisect_left(owners, report)
+        last = bisect_left(owners, report + 1, first)
+        return [[self.string(cells[c]) for c in range(coff[r], coff[r + 1])] for r in range(first, last)]
+
+    def _meta(self, n, section):
+        meta = self.column("r.meta")
+        sections = self.column("m.section"); keys = self.column("m.key"); values = self.column("m.value")
+        return {self.string(keys[m]): self.string(values[m]) for m in range(meta[n], meta[n + 1]) if sections[m] == section}
+
+    def _extra(self, name, n):
+        raw = self.string(self.column(name)[n])
+        return json.loads(raw) if raw else {}
+
+    def info_value(self, n, key):
+        if key == "header":
+            return self._meta(n, 0)
+        if key == "installed":
+            return self._meta(n, 1)
+        if key == "health_pct":
+            hp = self.column("r.health")[n]
+            return None if hp != hp else hp
+        if key in ("design_mWh", "full_mWh"):
+            v = self.column("r.design" if key == "design_mWh" else "r.full")[n]
+            return v if v >= 0 else None
+        return self.table_rows(key, n)
+
+    def info_extra(self, n):
+        return self._extra("r.xinfo", n)
+
+    def items(self):
+        summaries = self.column("r.summary"); paths = self.column("r.path"); xitems = self.column("r.xitem")
+        items = []
+        for n in range(len(self)):
+            item = {"summary": self.string(summaries[n]), "path": self.string(paths[n]), "info": _SnapshotInfo(self, n)}
+            if xitems[n]:
+                item.update(self._extra("r.xitem", n))
+            items.append(item)
+        return items
+
+    def to_items(self):
+        items = self.items()
+        for item in items:
+            item["info"].detach()
+        return items
+
+
+class _SnapshotInfo(dict):
+    def __init__(self, snap, n):
+        super().__init__()
+        self._snap = snap
+        self._n = n
+        self._pending = set(_SNAPSHOT_INFO_KEYS)
+        self._extra_loaded = False
+
+    def _fill(self, key):
+        snap = self._snap
+        if snap is None:
+            return
+        if key in self._pending:
+            dict.setdefault(self, key, snap.info_value(self._n, key))
+            self._pending.discard(key)
+        elif key not in _SNAPSHOT_INFO_KEYS:
+            self._load_extra(snap)
+
+    def _load_extra(self, snap):
+        if not self._extra_loaded:
+            for k, v in snap.info_extra(self._n).items():
+                dict.setdefault(self, k, v)
+            self._extra_loaded = True
+
+    def detach(self):
+        snap = self._snap
+        if snap is None:
+            return
+        for key in _SNAPSHOT_INFO_KEYS:
+            self._fill(key)
+        self._load_extra(snap)
+        self._snap = None
+
+    def __getitem__(self, key):
+        self._fill(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        self._fill(key)
+        return dict.get(self, key, default)
+
+    def __contains__(self, key):
+        self._fill(key)
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.detach()
+        return dict.__iter__(self)
+
+    def __bool__(self):
+        return True
+
+    def __len__(self):
+        snap = self._snap
+        if snap is not None:
+            self._load_extra(snap)
+        return dict.__len__(self) + len(self._pending)
+
+    def keys(self):
+        self.detach()
+        return dict.keys(self)
+
+    def items(self):
+        self.detach()
+        return dict.items(self)
+
+    def values(self):
+        self.detach()
+        return dict.values(self)
+
+
+def read_history_snapshot(path):
+    with ColumnarSnapshot(path) as snap:
+        return snap.to_items()
+
+
+def _detach_history_items(items):
+    for item in items:
+        info = item.get("info")
+        if isinstance(info, _SnapshotInfo):
+            info.detach()
+
+
+def _load_history():
+    if os.path.isfile(SNAPSHOT_FILE) and (not os.path.isfile(HISTORY_FILE) or os.path.getmtime(SNAPSHOT_FILE) >= os.path.getmtime(HISTORY_FILE)):
+        try:
+            snap = ColumnarSnapshot(SNAPSHOT_FILE)
+            return snap.items(), snap
+        except Exception:
+            pass
+    return _load_json(HISTORY_FILE, []) or [], None
+
+
+def _save_history(items):
+    _detach_history_items(items)
+    _save_json(HISTORY_FILE, items)
+
+
+_TOKEN_RE = re.compile(r"\w+")
+_QUERY_TOKEN_RE = re.compile(r"\d{4}-[\d:\- t]*\d|\d{4}-|\w+")
+
+
+class SearchIndex:
+    def __init__(self, sections=()):
+        postings = {}
+        for sec_idx, items in enumerate(sections):
+            for pos, item in enumerate(items):
+                tokens = set(_TOKEN_RE.findall(item[1].lower()))
+                if isinstance(item[0], datetime):
+                    tokens.add(item[0].strftime("%Y-%m-%d"))
+                    tokens.add(item[0].strftime("%Y-%m-%d %H:%M:%S"))
+                for token in tokens:
+                    postings.setdefault(token, set()).add((sec_idx, pos))
+        self._postings = postings
+        self._vocab = sorted(postings)
+
+    def _prefixed(self, prefix):
+        hits = set()
+        i = bisect_left(self._vocab, prefix)
+        while i < len(self._vocab) and self._vocab[i].startswith(prefix):
+            hits |= self._postings[self._vocab[i]]
+            i += 1
+        return hits
+
+    def search(self, query):
+        tokens = [t.replace("t", " ") if "-" in t else t for t in _QUERY_TOKEN_RE.findall((query or "").lower())]
+        if not tokens:
+            return []
+        groups = [self._postings.get(t, set()) for t in tokens[:-1]]
+        if not all(groups):
+            return []
+        groups.append(self._prefixed(tokens[-1]))
+        groups.sort(key=len)
+        result = set(groups[0])
+        for g in groups[1:]:
+            if not result:
+                break
+            result &= g
+        return sorted(result)
+
+
+DrainSession = namedtuple("DrainSession", "start state secs drained_mWh drained_pct mw pct_per_hour")
+
+
+def _pct_cell(cells):
+    for c in cells:
+        if "%" in (c or ""):
+            return _to_mWh(c)
+    return None
+
+
+def _mWh_cell(cells):
+    for c in cells:
+        if "mwh" in (c or "").lower():
+            return _to_mWh(c)
+    return None
+
+
+def _drain_session(start, state, secs, mWh, pct):
+    if not secs or mWh is None:
+        return None
+    return DrainSession(start, state, secs, mWh, pct, round(mWh * 3600.0 / secs), round(pct * 3600.0 / secs, 2) if pct is not None else None)
+
+
+def _drain_sessions(info):
+    sessions = []
+    for key, r in _keyed_rows(info.get("battery_usage", []), {"START TIME", "STATE", "DURATION", "ENERGY DRAINED"}).items():
+        start = _key_dt(key, "start")
+        if start is None or len(r) < 4:
+            continue
+        s = _drain_session(start, r[1], _parse_hms_to_secs(r[2]), _mWh_cell(r[3:]), _pct_cell(r[3:]))
+        if s:
+            sessions.append(s)
+    if sessions:
+        return sessions
+    rows = []
+    for key, r in _keyed_rows(info.get("recent_usage", []), {"START TIME", "STATE", "SOURCE", "CAPACITY REMAINING"}).items():
+        dt = _key_dt(key, "start")
+        if dt is not None and len(r) >= 4:
+            rows.append((dt, r))
+    rows.sort(key=lambda p: p[0])
+    for (dt, r), (next_dt, nr) in zip(rows, rows[1:]):
+        if _LABEL_LOOKUP.get(_norm_label(r[2])) != "BATTERY":
+            continue
+        m0 = _mWh_cell(r[3:]); m1 = _mWh_cell(nr[3:])
+        p0 = _pct_cell(r[3:]); p1 = _pct_cell(nr[3:])
+        if m0 is None or m1 is None or m1 > m0:
+            continue
+        pct = (p0 - p1) if (p0 is not None and p1 is not None) else None
+        s = _drain_session(dt, r[1], int((next_dt - dt).total_seconds()), m0 - m1, pct)
+        if s:
+            sessions.append(s)
+    return sessions
+
+
+class DrainIndex:
+    def __init__(self, infos=()):
+        self._seen = set()
+        self._by_rate = SortedIndex()
+        self._by_start = SortedIndex()
+        self._by_state = {}
+        self._lock = threading.Lock()
+        for info in infos:
+            self.add_report(info)
+
+    def __len__(self):
+        return len(self._by_rate)
+
+    def add_report(self, info):
+        sessions = _drain_sessions(info or {})
+        with self._lock:
+            self._add_sessions(sessions)
+
+    def _add_sessions(self, sessions):
+        for s in sessions:
+            key = (s.start, s.state)
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            self._by_rate.add(s.mw, s)
+            self._by_start.add(s.start, s)
+            totals = self._by_state.setdefault(s.state, [0, 0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += s.mw
+            if s.pct_per_hour is not None:
+                totals[2] += s.pct_per_hour
+                totals[3] += 1
+
+    def copy(self):
+        other = DrainIndex()
+        with self._lock:
+            other._seen = set(self._seen)
+            other._by_rate = self._by_rate.copy()
+            other._by_start = self._by_start.copy()
+            other._by_state = {state: list(totals) for state, totals in self._by_state.items()}
+        return other
+
+    def top(self, n):
+        return list(reversed(self._by_rate.tail(n)))
+
+    def sessions(self):
+        return self.top(len(self._by_rate))
+
+    def between(self, start=None, end=None):
+        return self._by_start.range(start, end)
+
+    def average_by_state(self):
+        return {
+            state: (count, round(sum_mw / count), round(sum_pct / pct_count, 2) if pct_count else None)
+            for state, (count, sum_mw, sum_pct, pct_count) in self._by_state.items()
+        }
+
+
+SAMPLER_INTERVAL = 10
+SAMPLER_CAPACITY = 720
+_SAMPLE_STATES = ("Unknown", "Charging", "Discharging", "Not charging", "Full")
+
+
+class SampleRing:
+    def __init__(self, capacity=SAMPLER_CAPACITY):
+        self.capacity = capacity
+        self._ts = array("d", bytes(8 * capacity))
+        self._charge = array("f", bytes(4 * capacity))
+        self._power = array("f", bytes(4 * capacity))
+        self._state = array("B", bytes(capacity))
+        self._next = 0
+        self._len = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._len
+
+    def append(self, ts, charge, power, state):
+        with self._lock:
+            i = self._next
+            self._ts[i] = ts
+            self._charge[i] = float("nan") if charge is None else charge
+            self._power[i] = float("nan") if power is None else power
+            self._state[i] = _SAMPLE_STATES.index(state) if state in _SAMPLE_STATES else 0
+            self._next = (i + 1) % self.capacity
+            self._len = min(self._len + 1, self.capacity)
+
+    def samples(self):
+        with self._lock:
+            start = (self._next - self._len) % self.capacity
+            idx = [(start + k) % self.capacity for k in range(self._len)]
+            return [(self._ts[i], self._charge[i], self._power[i], _SAMPLE_STATES[self._state[i]]) for i in idx]
+
+    def latest(self):
+        with self._lock:
+            if not self._len:
+                return None
+            i = (self._next - 1) % self.capacity
+            return (self._ts[i], self._charge[i], self._power[i], _SAMPLE_STATES[self._state[i]])
+
+
+class SysfsPowerSupplyBackend:
+    name = "sysfs"
+
+    def __init__(self, root="/sys/class/power_supply"):
+        self.root = root
+        self._batteries = None
+
+    def _read(self, bat, attr):
+        try:
+            with open(os.path.join(self.root, bat, attr), "r", encoding="utf-8", errors="replace") as f:
+                return f.read().strip()
+        except Exception:
+            return ""
+
+    def _read_int(self, bat, attr):
+        v = self._read(bat, attr)
+        try:
+            return int(v)
+        except ValueError:
+            return None
+
+    def batteries(self):
+        if self._batteries is None:
+            try:
+                names = sorted(os.listdir(self.root))
+            except Exception:
+                names = []
+            self._batteries = [n for n in names if self._read(n, "type").lower() == "battery"]
+        return self._batteries
+
+    def available(self):
+        return bool(self.batteries())
+
+    def _energy_mWh(self, bat, kind):
+        uwh = self._read_int(bat, f"energy_{kind}")
+        if uwh is not None:
+            return uwh // 1000
+        uah = self._read_int(bat, f"charge_{kind}")
+        uv = self._read_int(bat, "voltage_min_design") or self._read_int(bat, "voltage_now")
+        if uah is not None and uv:
+            return uah * uv // 10**9
+        return None
+
+    def read(self):
+        bats = self.batteries()
+        if not bats:
+            return None, None, "Unknown"
+        now = full = 0
+        pcts = []
+        power = None
+        state = "Unknown"
+        for bat in bats:
+            n = self._energy_mWh(bat, "now"); f = self._energy_mWh(bat, "full")
+            if n is not None and f:
+                now += n; full += f
+            pct = self._read_int(bat, "capacity")
+            if pct is not None:
+                pcts.append(pct)
+            uw = self._read_int(bat, "power_now")
+            if uw is None:
+                ua = self._read_int(bat, "current_now"); uv = self._read_int(bat, "voltage_now")
+                uw = abs(ua) * uv // 10**6 if (ua is not None and uv) else None
+            if uw is not None:
+                power = (power or 0) + uw / 1000.0
+            st = self._read(bat, "status")
+            if state == "Unknown" and st in _SAMPLE_STATES:
+                state = st
+        if full:
+            charge = round(now * 100.0 / full, 2)
+        else:
+            charge = sum(pcts) / float(len(pcts)) if pcts else None
+        return charge, power, state
+
+    def describe(self):
+        out = []
+        for bat in self.batteries():
+            design = self._energy_mWh(bat, "full_design"); full = self._energy_mWh(bat, "full")
+            out.append({
+                "Name": self._read(bat, "model_name") or bat,
+                "Manufacturer": self._read(bat, "manufacturer"),
+                "Serial number": self._read(bat, "serial_number"),
+                "Chemistry": self._read(bat, "technology"),
+                "Design capacity": f"{design:,} mWh" if design else "",
+                "Full charge capacity": f"{full:,} mWh" if full else "",
+                "Cycle count": self._read(bat, "cycle_count"),
+            })
+        return out
+
+
+SAMPLER_BACKENDS = [SysfsPowerSupplyBackend]
+
+
+def _default_sampler_backend():
+    for cls in SAMPLER_BACKENDS:
+        backend = cls()
+        if backend.available():
+            return backend
+    return None
+
+
+def _sampler_interval():
+    try:
+        return config.conf[CONFIG_SECTION]["sampleIntervalSeconds"]
+    except Exception:
+        return SAMPLER_INTERVAL
+
+
+class LiveSampler:
+    def __init__(self, backend=None, interval=None, capacity=SAMPLER_CAPACITY):
+        self.backend = backend or _default_sampler_backend()
+        self.interval = interval
+        self.ring = SampleRing(capacity)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample_once(self):
+        if not self.backend:
+            return None
+        charge, power, state = self.backend.read()
+        self.ring.append(time.time(), charge, power, state)
+        return self.ring.latest()
+
+    def start(self):
+        if not self.backend or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample_once()
+            except Exception:
+                pass
+            self._stop.wait(self.interval if self.interval is not None else _sampler_interval())
+
+    def to_info(self):
+        batteries = self.backend.describe() if self.backend else []
+        installed = batteries[0] if batteries else {}
+        design_mWh, full_mWh, health_pct = _battery_health(installed)
+        recent = [["START TIME", "STATE", "SOURCE", "CAPACITY REMAINING"]]
+        usage = [["START TIME", "STATE", "DURATION", "ENERGY DRAINED"]]
+        samples = self.ring.samples()
+        run = None
+        prev_state = None
+        for ts, charge, power, state in samples + [(None, None, None, None)]:
+            if state != prev_state and ts is not None:
+                stamp = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S")
+                source = "Battery" if state == "Discharging" else "AC"
+                pct = "-" if charge != charge else f"{round(charge)} %"
+                rem = f"{int(charge * full_mWh / 100):,} mWh" if (full_mWh and charge == charge) else "-"
+                recent.append([stamp, "Active", source, pct, rem])
+            if run and (state != "Discharging" or ts is None):
+                t0, c0, t1, c1 = run
+                if t1 > t0 and c0 == c0 and c1 == c1:
+                    drop = max(0.0, c0 - c1)
+                    energy = f"{int(drop * full_mWh / 100):,} mWh" if full_mWh else "-"
+                    stamp = datetime.fromtimestamp(t0).strftime("%Y-%m-%d %H:%M:%S")
+                    usage.append([stamp, "Active", _secs_to_hms(int(t1 - t0)), f"{round(drop)} %", energy])
+                run = None
+            if state == "Discharging":
+                run = (run[0], run[1], ts, charge) if run else (ts, charge, ts, charge)
+            prev_state = state
+        return {
+            "header": {
+                "Computer name": platform.node(),
+                "Report time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+            "installed": installed,
+            "design_mWh": design_mWh,
+            "full_mWh": full_mWh,
+            "health_pct": health_pct,
+            "recent_usage": recent if len(recent) > 1 else [],
+            "battery_usage": usage if len(usage) > 1 else [],
+            "usage_history": [],
+            "capacity_history": [],
+            "life_estimates": [],
+        }
+
+
 class DetailsDialog(wx.Dialog):
     SECTIONS = (
         ("overview", _("Overview")),
+        ("changes", _("Changes since previous report")),
         ("installed", _("Installed battery")),
         ("recent", _("Recent usage (last 7 days)")),
         ("battery_usage", _("Battery usage (last 7 days)")),
         ("capacity_history", _("Capacity history")),
         ("usage_history", _("Usage history")),
         ("life_estimates", _("Battery life estimates")),
+        ("drain", _("Drain sessions (all reports)")),
     )
+    TABLE_SECTIONS = {"usage_history", "capacity_history", "life_estimates", "drain"}
+    TABLE_BUILD_ORDER = ("recent", "battery_usage", "capacity_history", "usage_history", "life_estimates", "drain")
+    HISTORY_TABLES = {
+        "recent": ("recent_usage", "start"),
+        "battery_usage": ("battery_usage", "start"),
+        "capacity_history": ("capacity_history", "period"),
+        "usage_history": ("usage_history", "period"),
+        "life_estimates": ("life_estimates", "period"),
+    }
 
-    def __init__(self, parent, info):
+    def __init__(self, parent, info, previous=None, drain_index=None):
         super().__init__(parent, title=_("Battery report details"), size=(1020, 700))
         self.info = info
+        self.previous = previous
+        self.drain_index = drain_index.copy() if drain_index is not None else DrainIndex([info])
         pnl = wx.Panel(self)
         self.sectionLabel = wx.StaticText(pnl, label=_("&Section:"))
         self.section = wx.Choice(pnl, choices=[label for key, label in self.SECTIONS])
@@ -307,6 +1290,12 @@ class DetailsDialog(wx.Dialog):
         self.orderLabel = wx.StaticText(pnl, label=_("&Order:"))
         self.orderChoice = wx.Choice(pnl, choices=[_("Newest first"), _("Oldest first")])
         self.orderChoice.SetSelection(0)
+        self.fromLabel = wx.StaticText(pnl, label=_("&From:"))
+        self.fromCtrl = wx.TextCtrl(pnl, name=_("From date"))
+        self.toLabel = wx.StaticText(pnl, label=_("&To:"))
+        self.toCtrl = wx.TextCtrl(pnl, name=_("To date"))
+        self.searchLabel = wx.StaticText(pnl, label=_("S&earch:"))
+        self.searchCtrl = wx.TextCtrl(pnl, name=_("Search all sections"))
         self.listLabel = wx.StaticText(pnl, label=_("&Items:"))
         self.list = wx.ListBox(pnl, name=_("Items list"))
         self.descLabel = wx.StaticText(pnl, label=_("&Description:"))
@@ -316,13 +1305,19 @@ class DetailsDialog(wx.Dialog):
         self.btn_open_raw = wx.Button(pnl, label=_("&Open raw HTML"))
         self.btn_close = wx.Button(pnl, id=wx.ID_CANCEL, label=_("&Close"))
 
-        gridTop = wx.FlexGridSizer(2, 8, 5, 5)
+        gridTop = wx.FlexGridSizer(2, 10, 5, 5)
         gridTop.Add(self.sectionLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT | wx.TOP, 10)
         gridTop.Add(self.section, 0, wx.EXPAND | wx.TOP, 8)
         gridTop.Add(self.rowsLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.TOP, 10)
         gridTop.Add(self.rowsChoice, 0, wx.TOP, 8)
         gridTop.Add(self.orderLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.TOP, 10)
         gridTop.Add(self.orderChoice, 0, wx.TOP, 8)
+        gridTop.Add(self.fromLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.TOP, 10)
+        gridTop.Add(self.fromCtrl, 0, wx.TOP, 8)
+        gridTop.Add(self.toLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.TOP, 10)
+        gridTop.Add(self.toCtrl, 0, wx.TOP, 8)
+        gridTop.Add(self.searchLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
+        gridTop.Add(self.searchCtrl, 0, wx.EXPAND)
         gridTop.Add(self.listLabel, 0, wx.ALIGN_CENTER_VERTICAL | wx.LEFT, 10)
         gridTop.Add((1, 1))
 
@@ -349,29 +1344,53 @@ class DetailsDialog(wx.Dialog):
         root.Add(bs, 0, wx.EXPAND)
         pnl.SetSizer(root)
 
-        self._sections, self._section_lengths, self._prefix_counts, self._legends = self._build_sections(info)
+        self._legends = self._section_legends()
+        self._sections, self._section_lengths, self._prefix_counts = self._build_sections(info, previous)
+        self._date_range = (None, None)
+        self._history = None
+        self._row_items = {}
+        self._search_index = None
+        self._closing = threading.Event()
         self._apply_section("overview")
 
         self.section.Bind(wx.EVT_CHOICE, self._on_section_changed)
         self.rowsChoice.Bind(wx.EVT_CHOICE, self._on_rows_order)
         self.orderChoice.Bind(wx.EVT_CHOICE, self._on_rows_order)
+        self.fromCtrl.Bind(wx.EVT_TEXT, self._on_date_range)
+        self.toCtrl.Bind(wx.EVT_TEXT, self._on_date_range)
+        self.searchCtrl.Bind(wx.EVT_TEXT, self._on_search)
         self.list.Bind(wx.EVT_LISTBOX, self._on_select)
         self.btn_copy.Bind(wx.EVT_BUTTON, self._copy_selected)
         self.btn_open_raw.Bind(wx.EVT_BUTTON, lambda e: self._open_latest_html())
         self.btn_close.Bind(wx.EVT_BUTTON, lambda e: self.EndModal(wx.ID_CANCEL))
         self.Bind(wx.EVT_CHAR_HOOK, self._on_key)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
 
         self.section.MoveAfterInTabOrder(self.sectionLabel)
         self.rowsChoice.MoveAfterInTabOrder(self.section)
         self.orderChoice.MoveAfterInTabOrder(self.rowsChoice)
-        self.list.MoveAfterInTabOrder(self.orderChoice)
+        self.fromCtrl.MoveAfterInTabOrder(self.orderChoice)
+        self.toCtrl.MoveAfterInTabOrder(self.fromCtrl)
+        self.searchCtrl.MoveAfterInTabOrder(self.toCtrl)
+        self.list.MoveAfterInTabOrder(self.searchCtrl)
         self.desc.MoveAfterInTabOrder(self.list)
         self.btn_copy.MoveAfterInTabOrder(self.desc)
         self.btn_open_raw.MoveAfterInTabOrder(self.btn_copy)
         self.btn_close.MoveAfterInTabOrder(self.btn_open_raw)
         self.section.SetFocus()
+        threading.Thread(target=self._build_worker, args=(info,), daemon=True).start()
 
-    def _build_sections(self, info):
+    def _section_legends(self):
+        return {
+            "recent": _("Columns: Start time | State | Source | Remaining"),
+            "battery_usage": _("Columns: Start time | State | Duration | Energy drained"),
+            "capacity_history": _("Columns: Period | Full charge capacity | Design capacity"),
+            "usage_history": _("Columns: Period | Active | Connected standby"),
+            "life_estimates": _("Battery life estimates\nBattery life estimates based on observed drains\nColumns: Period | At full charge — Active, Connected standby | At design capacity — Active, Connected standby"),
+            "drain": _("Drain sessions from all stored reports, heaviest first\nColumns: Start time | State | Duration | Drain rate (mW, %/hour) | Energy drained"),
+        }
+
+    def _build_sections(self, info, previous=None):
         def add(items, label, value, desc):
             if value is None or value == "":
                 return
@@ -381,13 +1400,6 @@ class DetailsDialog(wx.Dialog):
         sections = {}
         lengths = {}
         prefixes = {}
-        legends = {
-            "recent": _("Columns: Start time | State | Source | Remaining"),
-            "battery_usage": _("Columns: Start time | State | Duration | Energy drained"),
-            "capacity_history": _("Columns: Period | Full charge capacity | Design capacity"),
-            "usage_history": _("Columns: Period | Active | Connected standby"),
-            "life_estimates": _("Battery life estimates\nBattery life estimates based on observed drains\nColumns: Period | At full charge — Active, Connected standby | At design capacity — Active, Connected standby"),
-        }
 
         items = []
         h = info.get("header", {})
@@ -407,112 +1419,210 @@ class DetailsDialog(wx.Dialog):
         lengths["overview"] = len(items)
         prefixes["overview"] = 0
 
+        items = self._build_changes(info, previous)
+        sections["changes"] = items
+        lengths["changes"] = len(items)
+        prefixes["changes"] = 0
+
         items = []
-        inst = info.get("installed", {})
-        add(items, _("Battery name"), inst.get("Name"), _("Identifier for the installed battery."))
-        add(items, _("Manufacturer"), inst.get("Manufacturer"), _("Battery vendor reported by firmware."))
-        add(items, _("Serial number"), inst.get("Serial number"), _("Battery serial number."))
-        add(items, _("Chemistry"), inst.get("Chemistry"), _("Battery chemistry code as reported by the system."))
-        add(items, _("Design capacity"), inst.get("Design capacity"), _("Factory-specified maximum energy (mWh)."))
-        add(items, _("Full charge capacity"), inst.get("Full charge capacity"), _("Current maximum energy (mWh) after wear."))
-        cc = inst.get("Cycle count")
-        if cc and cc not in ("-", "—"):
-            add(items, _("Cycle count"), cc, _("Number of full charge–discharge cycles recorded."))
+        batteries = info.get("batteries") or [{"installed": info.get("installed", {})}]
+        for n, bat in enumerate(batteries, 1):
+            inst = bat.get("installed", {})
+            pre = _("Battery {n} — ").format(n=n) if len(batteries) > 1 else ""
+            add(items, pre + _("Battery name"), inst.get("Name"), _("Identifier for the installed battery."))
+            add(items, pre + _("Manufacturer"), inst.get("Manufacturer"), _("Battery vendor reported by firmware."))
+            add(items, pre + _("Serial number"), inst.get("Serial number"), _("Battery serial number."))
+            add(items, pre + _("Chemistry"), inst.get("Chemistry"), _("Battery chemistry code as reported by the system."))
+            add(items, pre + _("Design capacity"), inst.get("Design capacity"), _("Factory-specified maximum energy (mWh)."))
+            add(items, pre + _("Full charge capacity"), inst.get("Full charge capacity"), _("Current maximum energy (mWh) after wear."))
+            cc = inst.get("Cycle count")
+            if cc and cc not in ("-", "—"):
+                add(items, pre + _("Cycle count"), cc, _("Number of full charge–discharge cycles recorded."))
+            if len(batteries) > 1 and bat.get("health_pct") is not None:
+                add(items, pre + _("Battery health"), f"{bat['health_pct']} %", _("Battery health = Full charge capacity / Design capacity."))
         sections["installed"] = items
         lengths["installed"] = len(items)
         prefixes["installed"] = 0
 
-        rec_items = _build_items_from_table(
+        loading = _("Loading...")
+        for key in self.TABLE_BUILD_ORDER:
+            sections[key] = [(None, loading, loading)]
+            lengths[key] = 0
+            prefixes[key] = 0
+
+        return sections, lengths, prefixes
+
+    def _build_table_sections(self, info):
+        legends = self._legends
+
+        def finalize(items, empty_msg, legend_key):
+            if not items:
+                return [(None, empty_msg, f"{empty_msg}\n\n{legends.get(legend_key, '')}")]
+            items.sort(key=lambda x: (x[0] or datetime.min), reverse=True)
+            return items
+
+        yield "recent", finalize(_build_items_from_table(
             info.get("recent_usage", []),
             {"START TIME", "STATE", "SOURCE", "CAPACITY REMAINING"},
             label_map={"START TIME": _("Start time"), "STATE": _("State"), "SOURCE": _("Source"), "CAPACITY REMAINING": _("Remaining")},
             date_key_kind="start",
-        )
-        bat_items = _build_items_from_table(
+            legend=legends["recent"],
+        ), _("No entries for the last 7 days."), "recent"), 0
+        yield "battery_usage", finalize(_build_items_from_table(
             info.get("battery_usage", []),
             {"START TIME", "STATE", "DURATION", "ENERGY DRAINED"},
             label_map={"START TIME": _("Start time"), "STATE": _("State"), "DURATION": _("Duration"), "ENERGY DRAINED": _("Energy drained")},
             date_key_kind="start",
-        )
-        cap_items = _build_items_from_table(
+            legend=legends["battery_usage"],
+        ), _("No entries for the last 7 days."), "battery_usage"), 0
+        yield "capacity_history", finalize(_build_items_from_table(
             info.get("capacity_history", []),
             {"PERIOD", "FULL CHARGE CAPACITY", "DESIGN CAPACITY"},
             label_map={"PERIOD": _("Period"), "FULL CHARGE CAPACITY": _("Full charge capacity"), "DESIGN CAPACITY": _("Design capacity")},
             date_key_kind="period",
-        )
-        use_items = _build_items_from_table(
+            legend=legends["capacity_history"],
+        ), _("No data."), "capacity_history"), 0
+        yield "usage_history", finalize(_build_items_from_table(
             info.get("usage_history", []),
             {"PERIOD", "ACTIVE", "CONNECTED STANDBY"},
             label_map={"PERIOD": _("Period"), "ACTIVE": _("Active"), "CONNECTED STANDBY": _("Connected standby")},
             date_key_kind="period",
-        )
+            legend=legends["usage_history"],
+        ), _("No data."), "usage_history"), 0
 
-        life_rows = info.get("life_estimates", [])
+        tP = _("Period"); tFC = _("At full charge"); tDC = _("At design capacity"); tA = _("Active"); tCS = _("Connected standby")
+        life_legend = legends["life_estimates"]
         life_items = []
-        for r in life_rows:
-            if _is_all_nulls(r):
-                continue
-            if {"PERIOD", "ACTIVE", "CONNECTED STANDBY"}.issubset(_upper_set(r)):
+        totals = [0, 0, 0, 0]; counts = [0, 0, 0, 0]
+        for r in info.get("life_estimates", []):
+            if len(r) < 6 or _is_all_nulls(r) or {"PERIOD", "ACTIVE", "CONNECTED STANDBY"}.issubset(_upper_set(r)):
                 continue
-            if len(r) >= 6:
-                period = _localize_cell("PERIOD", r[0])
-                tP = _("Period"); tFC = _("At full charge"); tDC = _("At design capacity"); tA = _("Active"); tCS = _("Connected standby")
-                line = f"{tP}: {period} | {tFC} — {tA}: {r[1]}, {tCS}: {r[2]} | {tDC} — {tA}: {r[4]}, {tCS}: {r[5]}"
-                key_dt = None
-                m = _PERIOD_RE.match(r[0])
-                if m:
-                    dt = _parse_dt(m.group(2))
-                    if dt:
-                        key_dt = dt
-                else:
-                    dt = _parse_dt(r[0])
-                    if dt:
-                        key_dt = dt
-                life_items.append((key_dt, line))
-        fc_act = []; fc_cs = []; dc_act = []; dc_cs = []
-        for r in life_rows:
-            if len(r) >= 6 and not _is_all_nulls(r) and not {"PERIOD", "ACTIVE", "CONNECTED STANDBY"}.issubset(_upper_set(r)):
-                s1 = _parse_hms_to_secs(r[1]); s2 = _parse_hms_to_secs(r[2]); s3 = _parse_hms_to_secs(r[4]); s4 = _parse_hms_to_secs(r[5])
-                if s1 is not None: fc_act.append(s1)
-                if s2 is not None: fc_cs.append(s2)
-                if s3 is not None: dc_act.append(s3)
-                if s4 is not None: dc_cs.append(s4)
-        def avg(lst):
-            return _secs_to_hms(sum(lst)//len(lst)) if lst else _("-")
+            for i, cell in enumerate((r[1], r[2], r[4], r[5])):
+                secs = _parse_hms_to_secs(cell)
+                if secs is not None:
+                    totals[i] += secs; counts[i] += 1
+            line = f"{tP}: {_localize_cell('PERIOD', r[0])} | {tFC} — {tA}: {r[1]}, {tCS}: {r[2]} | {tDC} — {tA}: {r[4]}, {tCS}: {r[5]}"
+            life_items.append((_key_dt(r[0], "period"), line, f"{line}\n\n{life_legend}"))
         if life_items:
-            tAVG = _("Average"); tFC = _("At full charge"); tDC = _("At design capacity"); tA = _("Active"); tCS = _("Connected standby")
-            avg_line = f"{tAVG} | {tFC} — {tA}: {avg(fc_act)}, {tCS}: {avg(fc_cs)} | {tDC} — {tA}: {avg(dc_act)}, {tCS}: {avg(dc_cs)}"
-            life_items = [(None, avg_line)] + life_items
-            prefixes["life_estimates"] = 1
+            avg = [_secs_to_hms(t // c) if c else _("-") for t, c in zip(totals, counts)]
+            avg_line = f"{_('Average')} | {tFC} — {tA}: {avg[0]}, {tCS}: {avg[1]} | {tDC} — {tA}: {avg[2]}, {tCS}: {avg[3]}"
+            yield "life_estimates", [(None, avg_line, f"{avg_line}\n\n{life_legend}")] + life_items, 1
         else:
-            prefixes["life_estimates"] = 0
+            yield "life_estimates", [], 0
 
-        def finalize(items, empty_msg, legend_key):
-            if not items:
-                line = empty_msg
-                return [(None, line, f"{line}\n\n{legends.get(legend_key, '')}")]
-            items_sorted = sorted(items, key=lambda x: (x[0] or datetime.min), reverse=True)
-            return [(k, line, f"{line}\n\n{legends.get(legend_key, '')}") for (k, line) in items_sorted]
+        drain_items, prefix = self._build_drain(self.drain_index)
+        yield "drain", [(k, s, f"{s}\n\n{legends['drain']}") for (k, s) in drain_items], prefix
 
-        sections["recent"] = finalize(rec_items, _("No entries for the last 7 days."), "recent")
-        sections["battery_usage"] = finalize(bat_items, _("No entries for the last 7 days."), "battery_usage")
-        sections["capacity_history"] = finalize(cap_items, _("No data."), "capacity_history")
-        sections["usage_history"] = finalize(use_items, _("No data."), "usage_history")
-        sections["life_estimates"] = [(k, s, f"{s}\n\n{legends['life_estimates']}") for (k, s) in life_items]
+    def _build_worker(self, info):
+        sections = dict(self._sections)
+        pending = list(self.TABLE_BUILD_ORDER)
+        try:
+            wx.CallAfter(self._history_ready, HistoryIndex([{"info": info}]))
+            for key, items, prefix in self._build_table_sections(info):
+                if self._closing.is_set():
+                    return
+                sections[key] = items
+                pending.remove(key)
+                row_items = {}
+                for pos, it in enumerate(items[prefix:]):
+                    if it[0] is not None:
+                        row_items.setdefault(it[0], []).append((pos, it))
+                wx.CallAfter(self._section_ready, key, items, prefix, row_items)
+        except Exception as e:
+            line = _("Could not load this section: {m}").format(m=e)
+            for key in pending:
+                sections[key] = [(None, line, line)]
+                wx.CallAfter(self._section_ready, key, sections[key], 0, {})
+        wx.CallAfter(self._sections_done, SearchIndex(sections.get(key, []) for key, label in self.SECTIONS))
+
+    def _history_ready(self, history):
+        if not self._closing.is_set() and self:
+            self._history = history
+
+    def _section_ready(self, key, items, prefix, row_items):
+        if self._closing.is_set() or not self:
+            return
+        self._sections[key] = items
+        self._prefix_counts[key] = prefix
+        self._section_lengths[key] = max(0, len(items) - prefix)
+        self._row_items[key] = row_items
+        if self._get_current_key() == key and not self.searchCtrl.GetValue().strip():
+            self._apply_section(key)
+
+    def _sections_done(self, search_index):
+        if self._closing.is_set() or not self:
+            return
+        self._search_index = search_index
+        if self.searchCtrl.GetValue().strip():
+            self._refresh_list()
 
-        for key in ("recent", "battery_usage", "capacity_history", "usage_history", "life_estimates"):
-            lengths[key] = max(0, len(sections[key]) - prefixes.get(key, 0))
-            prefixes.setdefault(key, 0)
+    def _on_destroy(self, evt):
+        self._closing.set()
+        evt.Skip()
+
+    def _build_changes(self, info, previous):
+        if not previous:
+            line = _("No previous report to compare with.")
+            return [(None, line, line)]
+        d = diff_reports(previous, info)
+        items = []
+        hp = d["health_pct"]; fm = d["full_mWh"]; cc = d["cycle_count"]
+        if hp is not None:
+            line = _("Battery health: {delta:+.2f} percentage points").format(delta=hp)
+            items.append((None, line, _("{line}\n\nChange in battery health since the previous report.").format(line=line)))
+        if fm is not None:
+            line = _("Full charge capacity: {delta:+,} mWh").format(delta=fm)
+            items.append((None, line, _("{line}\n\nChange in current maximum energy since the previous report.").format(line=line)))
+        if cc is not None:
+            line = _("Cycle count: {delta:+}").format(delta=cc)
+            items.append((None, line, _("{line}\n\nCycles recorded since the previous report.").format(line=line)))
+        for key, headers, label in _DIFF_TABLES:
+            added = d["tables"][key]["added"]
+            if not added:
+                continue
+            kind = "PERIOD" if "PERIOD" in headers else "START TIME"
+            for r in added:
+                cells = [_localize_cell(kind, r[0])] + [c for c in r[1:] if c]
+                line = _("{table} — new: {row}").format(table=label, row=" | ".join(cells))
+                items.append((None, line, _("{line}\n\nRow not present in the previous report.").format(line=line)))
+        if not items:
+            line = _("No changes since the previous report.")
+            items.append((None, line, line))
+        return items
 
-        return sections, lengths, prefixes, legends
+    def _build_drain(self, index):
+        tS = _("Start time"); tSt = _("State"); tD = _("Duration"); tR = _("Drain rate"); tE = _("Energy drained")
+        items = []
+        for state, (count, avg_mw, avg_pct) in sorted(index.average_by_state().items()):
+            rate = f"{avg_mw:,} mW" + (f", {avg_pct} %/h" if avg_pct is not None else "")
+            line = _("Average — {state}: {rate} ({count} sessions)").format(state=state, rate=rate, count=count)
+            items.append((None, line))
+        prefix = len(items)
+        for sess in index.sessions():
+            rate = f"{sess.mw:,} mW" + (f", {sess.pct_per_hour} %/h" if sess.pct_per_hour is not None else "")
+            line = f"{tS}: {_fmt_dt_local(sess.start)} | {tSt}: {sess.state} | {tD}: {_secs_to_hms(sess.secs)} | {tR}: {rate} | {tE}: {sess.drained_mWh:,} mWh"
+            items.append((sess.start, line))
+        if not items:
+            items.append((None, _("No drain sessions recorded.")))
+        return items, prefix
 
     def _apply_section(self, key):
         self._toggle_rows_controls(key)
         self._populate_rows_choice(key)
+        self._populate_order_choice(key)
         self._refresh_list(key)
 
+    def _populate_order_choice(self, key):
+        if key == "drain":
+            labels = (_("Heaviest first"), _("Lightest first"))
+        else:
+            labels = (_("Newest first"), _("Oldest first"))
+        for i, label in enumerate(labels):
+            if self.orderChoice.GetString(i) != label:
+                self.orderChoice.SetString(i, label)
+
     def _toggle_rows_controls(self, key):
-        table_like = key in {"usage_history", "capacity_history", "life_estimates"}
+        table_like = key in self.TABLE_SECTIONS
         self.rowsLabel.Enable(table_like)
         self.rowsChoice.Enable(table_like)
         self.orderLabel.Enable(table_like)
@@ -521,7 +1631,7 @@ class DetailsDialog(wx.Dialog):
     def _populate_rows_choice(self, key):
         self.rowsChoice.Clear()
         n = self._section_lengths.get(key, 0)
-        if key not in {"usage_history", "capacity_history", "life_estimates"}:
+        if key not in self.TABLE_SECTIONS:
             return
         maxOpt = max(10, ((n + 9)//10)*10)
         opts = [str(x) for x in range(10, maxOpt + 1, 10)]
@@ -540,8 +1650,21 @@ class DetailsDialog(wx.Dialog):
 
     def _refresh_list(self, key=None):
         key = key or self._get_current_key()
+        query = self.searchCtrl.GetValue().strip()
+        if query:
+            if self._search_index is None:
+                self._show_items([], _("Search is still loading..."))
+            else:
+                self._show_items(self._search_items(query), _("No matches found."))
+            return
         items = list(self._sections.get(key, []))
-        if key in {"usage_history", "capacity_history", "life_estimates"}:
+        lo, hi = self._date_range
+        if (lo or hi) and key in self._row_items:
+            prefix = self._prefix_counts.get(key, 0)
+            row_items = self._row_items[key]
+            found = [p for dt in dict.fromkeys(self._dates_between(key, lo, hi)) for p in row_items.get(dt, ())]
+            items = items[:prefix] + [it for pos, it in sorted(found, key=lambda p: p[0])]
+        if key in self.TABLE_SECTIONS:
             take = None
             try:
                 take = int(self.rowsChoice.GetStringSelection())
@@ -562,6 +1685,25 @@ class DetailsDialog(wx.Dialog):
                 take = n
             kept = base[:min(take, n)]
             items = (items[:prefix] if prefix else []) + kept
+        self._show_items(items)
+
+    def _dates_between(self, key, lo, hi):
+        if key == "drain":
+            return [s.start for s in self.drain_index.between(lo, hi)]
+        if key not in self.HISTORY_TABLES or self._history is None:
+            return []
+        table, kind = self.HISTORY_TABLES[key]
+        return [_key_dt(r[0], kind) for r in self._history.rows_between(table, lo, hi)]
+
+    def _search_items(self, query):
+        items = []
+        for sec_idx, pos in self._search_index.search(query):
+            key, label = self.SECTIONS[sec_idx]
+            k, line, desc = self._sections[key][pos]
+            items.append((k, f"{label}: {line}", desc))
+        return items
+
+    def _show_items(self, items, empty_msg=None):
         self._current_items = items
         self.list.Clear()
         if items:
@@ -569,7 +1711,7 @@ class DetailsDialog(wx.Dialog):
             self.list.SetSelection(0)
             self._update_desc_from_selection()
         else:
-            self.desc.SetValue(_("No data for this section."))
+            self.desc.SetValue(empty_msg or _("No data for this section."))
             self.desc.SetInsertionPoint(0)
 
     def _on_section_changed(self, evt):
@@ -578,6 +1720,18 @@ class DetailsDialog(wx.Dialog):
     def _on_rows_order(self, evt):
         self._refresh_list()
 
+    def _on_search(self, evt):
+        self._refresh_list()
+
+    def _on_date_range(self, evt):
+        lo = _parse_user_date(self.fromCtrl.GetValue())
+        hi = _parse_user_date(self.toCtrl.GetValue())
+        if hi is not None and hi.hour == hi.minute == hi.second == 0:
+            hi = hi.replace(hour=23, minute=59, second=59)
+        if (lo, hi) != self._date_range:
+            self._date_range = (lo, hi)
+            self._refresh_list()
+
     def _on_select(self, evt):
         self._update_desc_from_selection()
 
@@ -621,42 +1775,373 @@ class DetailsDialog(wx.Dialog):
         event.Skip()
 
 
+def _capacity_fade(info):
+    points = []
+    for key, r in _keyed_rows(info.get("capacity_history", []), {"PERIOD", "FULL CHARGE CAPACITY", "DESIGN CAPACITY"}).items():
+        dt = _key_dt(key, "period")
+        full = _to_mWh(r[1]) if len(r) > 1 else None
+        if dt and full:
+            points.append((dt, full))
+    if len(points) < 2:
+        return None
+    points.sort()
+    days = (points[-1][0] - points[0][0]).days
+    if days <= 0:
+        return None
+    return round((points[-1][1] - points[0][1]) * 30.44 / days)
+
+
+def build_health_summary(info):
+    return {
+        "report_time": (info.get("header") or {}).get("Report time", ""),
+        "health_pct": info.get("health_pct"),
+        "design_mWh": info.get("design_mWh"),
+        "full_mWh": info.get("full_mWh"),
+        "cycle_count": _to_mWh((info.get("installed") or {}).get("Cycle count")),
+        "fade_mWh_per_month": _capacity_fade(info),
+    }
+
+
+def _summary_max_age():
+    try:
+        return config.conf[CONFIG_SECTION]["summaryMaxAgeHours"] * 3600
+    except Exception:
+        return 24 * 3600
+
+
+class SummaryCache:
+    def __init__(self, path=None, max_age=None):
+        self.path = path or SUMMARY_FILE
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._data = _load_json(path, None)
+
+    def get(self):
+        with self._lock:
+            return self._data
+
+    def update(self, info):
+        data = build_health_summary(info) if info else None
+        with self._lock:
+            self._data = data
+        _save_json(self.path, data)
+
+    def is_stale(self):
+        data = self.get()
+        if not data:
+            return True
+        max_age = self.max_age if self.max_age is not None else _summary_max_age()
+        if not max_age:
+            return False
+        report_dt = _parse_dt(data.get("report_time") or "")
+        if report_dt is None:
+            return True
+        return (datetime.now() - report_dt).total_seconds() > max_age
+
+    def describe(self):
+        data = self.get()
+        if not data:
+            return ""
+        parts = []
+        hp = data.get("health_pct"); dm = data.get("design_mWh"); fm = data.get("full_mWh")
+        if hp is not None and dm and fm:
+            parts.append(_("Battery health {hp}% ({full:,} of {des:,} mWh)").format(hp=hp, full=fm, des=dm))
+        if data.get("cycle_count") is not None:
+            parts.append(_("{n} cycles").format(n=data["cycle_count"]))
+        fade = data.get("fade_mWh_per_month")
+        if fade is not None:
+            if fade < 0:
+                parts.append(_("losing about {n:,} mWh per month").format(n=-fade))
+            else:
+                parts.append(_("capacity stable"))
+        dt = _parse_dt(data.get("report_time") or "")
+        if dt:
+            parts.append(_("report from {ts}").format(ts=_fmt_dt_local(dt)))
+        return ", ".join(parts) if parts else _("No battery health data in the last report.")
+
+
+class BatteryReportSettingsPanel(SettingsPanel):
+    title = _("NVDA Battery Report")
+
+    def makeSettings(self, settingsSizer):
+        helper = guiHelper.BoxSizerHelper(self, sizer=settingsSizer)
+        self.maxAgeCtrl = helper.addLabeledControl(
+            _("Regenerate the spoken health summary when the report is older than (&hours, 0 = never):"),
+            nvdaControls.SelectOnFocusSpinCtrl, min=0, max=720, initial=config.conf[CONFIG_SECTION]["summaryMaxAgeHours"])
+        self.intervalCtrl = helper.addLabeledControl(
+            _("Live battery &sampling interval (seconds):"),
+            nvdaControls.SelectOnFocusSpinCtrl, min=1, max=3600, initial=config.conf[CONFIG_SECTION]["sampleIntervalSeconds"])
+
+    def onSave(self):
+        config.conf[CONFIG_SECTION]["summaryMaxAgeHours"] = self.maxAgeCtrl.GetValue()
+        config.conf[CONFIG_SECTION]["sampleIntervalSeconds"] = self.intervalCtrl.GetValue()
+
+
+class ReportJobManager:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._history_lock = threading.Lock()
+        self._listeners = []
+        self._requesters = set()
+        self._running = False
+        self._items = None
+        self._snapshot = None
+        self._keep_snapshot = False
+        self._drain_index = None
+        self._history_index = None
+        self.summary = SummaryCache()
+        self.sampler = LiveSampler()
+
+    def _ensure_loaded(self):
+        if self._items is not None:
+            return
+        self._items, self._snapshot = _load_history()
+        self._keep_snapshot = self._snapshot is not None
+        self._reindex()
+        if self.summary.get() is None and self._items:
+            self.summary.update(self._items[0].get("info", {}))
+
+    def load(self):
+        with self._history_lock:
+            self._ensure_loaded()
+
+    def _reindex(self):
+        self._drain_index = DrainIndex(it.get("info", {}) for it in reversed(self._items))
+        self._history_index = HistoryIndex(self._items, rows=False)
+
+    @property
+    def items(self):
+        with self._history_lock:
+            self._ensure_loaded()
+            return self._items
+
+    @property
+    def drain_index(self):
+        with self._history_lock:
+            self._ensure_loaded()
+            return self._drain_index
+
+    @property
+    def busy(self):
+        with self._lock:
+            return self._running
+
+    def add_listener(self, listener):
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            self._requesters.discard(listener)
+
+    def generate(self, requester=None):
+        with self._lock:
+            if requester is not None:
+                self._requesters.add(requester)
+            if self._running:
+                return False
+            self._running = True
+        threading.Thread(target=self._worker_thread, daemon=True).start()
+        return True
+
+    def _worker_thread(self):
+        try:
+            path, html = generate_battery_report()
+            info = parse_battery_report(html)
+            item = self.add_report(path, info)
+            self._notify("_job_done", item)
+        except Exception as e:
+            self._notify("_job_error", str(e))
+
+    def _notify(self, name, *args):
+        with self._lock:
+            listeners = list(self._listeners)
+            requesters = self._requesters
+            self._requesters = set()
+            self._running = False
+        for listener in listeners:
+            wx.CallAfter(self._dispatch, listener, name, args + (listener in requesters,))
+
+    def _dispatch(self, listener, name, args):
+        with self._lock:
+            alive = listener in self._listeners
+        if alive:
+            getattr(listener, name)(*args)
+
+    def _broadcast(self):
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            wx.CallAfter(self._dispatch, listener, "_history_changed", ())
+
+    def add_report(self, path, info):
+        item = {"summary": format_summary(info), "path": path, "info": info}
+        with self._history_lock:
+            self._ensure_loaded()
+            evicted = len(self._items) >= HISTORY_LIMIT
+            self._items = [item] + self._items[:HISTORY_LIMIT - 1]
+            if evicted:
+                self._reindex()
+            else:
+                self._drain_index.add_report(info)
+                self._history_index.add(item)
+            self._persist()
+        self.summary.update(info)
+        return item
+
+    def add_live_report(self):
+        if not self.sampler.backend:
+            return None
+        self.sampler.sample_once()
+        item = self.add_report("", self.sampler.to_info())
+        self._broadcast()
+        return item
+
+    def _persist(self):
+        _save_history(self._items)
+        if self._keep_snapshot:
+            self._release_snapshot()
+            try:
+                write_history_snapshot(self._items, SNAPSHOT_FILE)
+            except Exception:
+                pass
+
+    def close(self):
+        self.sampler.stop()
+        with self._history_lock:
+            if self._snapshot is not None:
+                self._snapshot.close()
+                self._snapshot = None
+                self._items = self._drain_index = self._history_index = None
+
+    def _release_snapshot(self):
+        if self._snapshot is not None:
+            _detach_history_items(self._items)
+            self._snapshot.close()
+            self._snapshot = None
+
+    def export_snapshot(self, path=SNAPSHOT_FILE):
+        with self._history_lock:
+            self._ensure_loaded()
+            self._release_snapshot()
+            write_history_snapshot(self._items, path)
+            if os.path.abspath(path) == os.path.abspath(SNAPSHOT_FILE):
+                self._keep_snapshot = True
+            return len(self._items)
+
+    def import_snapshot(self, path=SNAPSHOT_FILE):
+        items = read_history_snapshot(path)
+        with self._history_lock:
+            self._release_snapshot()
+            self._items = items
+            self._reindex()
+            self._persist()
+        self.summary.update(items[0].get("info", {}) if items else None)
+        self._broadcast()
+        return len(items)
+
+    def previous_report(self, item):
+        previous = None
+        with self._history_lock:
+            self._ensure_loaded()
+            if _parse_dt(((item.get("info") or {}).get("header") or {}).get("Report time") or ""):
+                previous = self._history_index.previous_report(item)
+            else:
+                for i, it in enumerate(self._items[:-1]):
+                    if it is item:
+                        previous = self._items[i + 1]
+                        break
+        return previous.get("info", {}) if previous else None
+
+    def delete(self, item):
+        with self._history_lock:
+            self._ensure_loaded()
+            was_latest = bool(self._items) and self._items[0] is item
+            _remove_report_file(item)
+            self._items = [it for it in self._items if it is not item]
+            self._reindex()
+            self._persist()
+        if was_latest:
+            self.summary.update(self._items[0].get("info", {}) if self._items else None)
+        self._broadcast()
+
+    def clear(self):
+        with self._history_lock:
+            self._ensure_loaded()
+            for it in self._items:
+                _remove_report_file(it)
+            self._items = []
+            self._reindex()
+            self._persist()
+        self.summary.update(None)
+        self._broadcast()
+
+
+def _remove_report_file(item):
+    try:
+        p = item.get("path")
+        if p and os.path.isfile(p):
+            os.remove(p)
+    except Exception:
+        pass
+
+
 class BatteryReportDialog(wx.Dialog):
-    def __init__(self, parent):
+    def __init__(self, parent, jobs):
         super().__init__(parent, title=DIALOG_TITLE, size=(640, 620))
-        self.worker = None
-        self.items = _load_json(HISTORY_FILE, []) or []
+        self.jobs = jobs
+        self.items = list(jobs.items)
         pnl = wx.Panel(self)
         self.info = wx.StaticText(pnl, label=_("Click Generate to create a Windows battery report using powercfg."))
         self.btn_generate = wx.Button(pnl, label=_("&Generate report"))
+        self.btn_live = wx.Button(pnl, label=_("Record &live sample"))
         self.lst = wx.ListBox(pnl, name=_("Battery reports history"))
         self.btn_view = wx.Button(pnl, label=_("&View details"))
         self.btn_delete = wx.Button(pnl, label=_("&Delete"))
         self.btn_clear = wx.Button(pnl, label=_("&Clear history"))
+        self.btn_export = wx.Button(pnl, label=_("E&xport snapshot"))
+        self.btn_import = wx.Button(pnl, label=_("&Import snapshot..."))
         btn_close = wx.Button(pnl, id=wx.ID_CLOSE, label=_("&Close"))
         v = wx.BoxSizer(wx.VERTICAL)
         v.Add(self.info, 0, wx.ALL | wx.EXPAND, 10)
         v.Add(self.btn_generate, 0, wx.ALL | wx.EXPAND, 10)
+        v.Add(self.btn_live, 0, wx.LEFT | wx.RIGHT | wx.EXPAND, 10)
         v.Add(wx.StaticText(pnl, label=_("History:")), 0, wx.LEFT, 10)
         v.Add(self.lst, 1, wx.ALL | wx.EXPAND, 10)
         v.Add(self.btn_view, 0, wx.LEFT | wx.EXPAND, 10)
         v.Add(self.btn_delete, 0, wx.LEFT | wx.EXPAND, 10)
         v.Add(self.btn_clear, 0, wx.LEFT | wx.EXPAND, 10)
+        v.Add(self.btn_export, 0, wx.LEFT | wx.EXPAND, 10)
+        v.Add(self.btn_import, 0, wx.LEFT | wx.EXPAND, 10)
         v.Add(btn_close, 0, wx.ALL | wx.ALIGN_RIGHT, 10)
         pnl.SetSizer(v)
         self.btn_generate.Bind(wx.EVT_BUTTON, self._on_generate)
+        self.btn_live.Bind(wx.EVT_BUTTON, self._on_live)
+        self.btn_live.Enable(bool(jobs.sampler.backend))
         self.btn_view.Bind(wx.EVT_BUTTON, self._on_view)
         self.btn_delete.Bind(wx.EVT_BUTTON, self._on_delete)
         self.btn_clear.Bind(wx.EVT_BUTTON, self._on_clear)
+        self.btn_export.Bind(wx.EVT_BUTTON, self._on_export)
+        self.btn_import.Bind(wx.EVT_BUTTON, self._on_import)
         btn_close.Bind(wx.EVT_BUTTON, self._on_close)
         self.lst.Bind(wx.EVT_LISTBOX, lambda e: self._update_buttons())
         self.Bind(wx.EVT_CHAR_HOOK, self._on_key)
         self.Bind(wx.EVT_CLOSE, self._on_close)
+        self._fill_list()
+        jobs.add_listener(self)
+        if jobs.busy:
+            self.btn_generate.Enable(False)
+            self.info.SetLabel(_("Generating report... Please wait."))
+
+    def _fill_list(self):
+        self.lst.Clear()
         if not self.items:
             self.lst.Append(EMPTY_HISTORY_MSG)
         else:
-            for it in self.items:
-                self.lst.Append(it.get("summary", ""))
+            self.lst.InsertItems([it.get("summary", "") for it in self.items], 0)
         self._update_buttons()
 
     def _update_buttons(self):
@@ -665,11 +2150,13 @@ class BatteryReportDialog(wx.Dialog):
             self.btn_view.Enable(False)
             self.btn_delete.Enable(False)
             self.btn_clear.Enable(False)
+            self.btn_export.Enable(False)
         else:
             has_sel = self.lst.GetSelection() != wx.NOT_FOUND
             self.btn_view.Enable(has_sel)
             self.btn_delete.Enable(has_sel)
             self.btn_clear.Enable(bool(self.items))
+            self.btn_export.Enable(bool(self.items))
 
     def _on_key(self, evt):
         if evt.GetKeyCode() == wx.WXK_ESCAPE:
@@ -678,31 +2165,32 @@ class BatteryReportDialog(wx.Dialog):
         evt.Skip()
 
     def _on_generate(self, evt):
-        if self.worker and self.worker.is_alive():
-            return
         self.btn_generate.Enable(False)
         self.info.SetLabel(_("Generating report... Please wait."))
-        self.worker = threading.Thread(target=self._worker_thread, daemon=True)
-        self.worker.start()
+        self.jobs.generate(self)
 
-    def _worker_thread(self):
-        try:
-            path, html = generate_battery_report()
-            info = parse_battery_report(html)
-            wx.CallAfter(self._finish, path, info)
-        except Exception as e:
-            wx.CallAfter(self._error, str(e))
+    def _on_live(self, evt):
+        item = self.jobs.add_live_report()
+        if item:
+            self.info.SetLabel(item.get("summary", "").replace("\n", "  "))
 
-    def _finish(self, path, info):
+    def _history_changed(self):
+        sel = self.lst.GetSelection()
+        selected = self.items[sel] if (sel != wx.NOT_FOUND and sel < len(self.items)) else None
+        self.items = list(self.jobs.items)
+        self._fill_list()
+        if selected is not None and selected in self.items:
+            self.lst.SetSelection(self.items.index(selected))
+            self._update_buttons()
+
+    def _job_done(self, item, requested):
         self.btn_generate.Enable(True)
-        summary = format_summary(info)
-        if self.lst.GetCount() == 1 and self.lst.GetString(0) == EMPTY_HISTORY_MSG:
-            self.lst.Delete(0)
-        self.lst.InsertItems([summary], 0)
-        self.items.insert(0, {"summary": summary, "path": path, "info": info})
-        _save_json(HISTORY_FILE, self.items[:100])
-        self._update_buttons()
+        self._history_changed()
+        summary = item.get("summary", "")
         self.info.SetLabel(summary.replace("\n", "  "))
+        if not requested:
+            return
+        info = item.get("info", {})
         hp = info.get("health_pct"); dm = info.get("design_mWh"); fm = info.get("full_mWh")
         if hp is not None and dm and fm:
             msg = _("Report generated. Battery health: {hp}% ({full:,}/{des:,} mWh)").format(hp=hp, full=fm, des=dm)
@@ -710,7 +2198,7 @@ class BatteryReportDialog(wx.Dialog):
             msg = _("Report generated.")
         wx.MessageBox(msg, _("Battery report"), style=wx.OK | wx.ICON_INFORMATION)
 
-    def _error(self, msg):
+    def _job_error(self, msg, requested):
         self.btn_generate.Enable(True)
         self.info.SetLabel(_("Error: {m}").format(m=msg))
 
@@ -719,7 +2207,7 @@ class BatteryReportDialog(wx.Dialog):
         if sel == wx.NOT_FOUND:
             return
         item = self.items[sel]
-        dlg = DetailsDialog(self, item.get("info", {}))
+        dlg = DetailsDialog(self, item.get("info", {}), self.jobs.previous_report(item), self.jobs.drain_index)
         dlg.ShowModal(); dlg.Destroy()
 
     def _on_delete(self, evt):
@@ -728,18 +2216,7 @@ class BatteryReportDialog(wx.Dialog):
             return
         dlg = wx.MessageDialog(self, _("Are you sure you want to delete this report?"), _("Confirm delete"), style=wx.YES_NO | wx.ICON_WARNING)
         if dlg.ShowModal() == wx.ID_YES:
-            try:
-                path = self.items[sel].get("path")
-                if path and os.path.isfile(path):
-                    os.remove(path)
-            except Exception:
-                pass
-            self.lst.Delete(sel)
-            del self.items[sel]
-            _save_json(HISTORY_FILE, self.items)
-            if not self.items:
-                self.lst.Append(EMPTY_HISTORY_MSG)
-            self._update_buttons()
+            self.jobs.delete(self.items[sel])
         dlg.Destroy()
 
     def _on_clear(self, evt):
@@ -747,23 +2224,34 @@ class BatteryReportDialog(wx.Dialog):
             return
         dlg = wx.MessageDialog(self, _("Clear all reports and delete files?"), _("Clear history"), style=wx.YES_NO | wx.ICON_QUESTION)
         if dlg.ShowModal() == wx.ID_YES:
-            for it in self.items:
-                try:
-                    p = it.get("path")
-                    if p and os.path.isfile(p):
-                        os.remove(p)
-                except Exception:
-                    pass
-            self.items.clear()
-            _save_json(HISTORY_FILE, [])
-            self.lst.Clear()
-            self.lst.Append(EMPTY_HISTORY_MSG)
-            self._update_buttons()
+            self.jobs.clear()
+        dlg.Destroy()
+
+    def _on_export(self, evt):
+        try:
+            n = self.jobs.export_snapshot()
+            self.info.SetLabel(_("Exported {n} reports to {path}").format(n=n, path=SNAPSHOT_FILE))
+        except Exception as e:
+            self.info.SetLabel(_("Error: {m}").format(m=e))
+
+    def _on_import(self, evt):
+        dlg = wx.FileDialog(self, _("Import battery history snapshot"), defaultDir=ADDON_DIR, defaultFile=os.path.basename(SNAPSHOT_FILE),
+            wildcard=_("Battery history snapshot (*.bin)|*.bin"), style=wx.FD_OPEN | wx.FD_FILE_MUST_EXIST)
+        path = dlg.GetPath() if dlg.ShowModal() == wx.ID_OK else None
+        dlg.Destroy()
+        if not path:
+            return
+        dlg = wx.MessageDialog(self, _("Replace the current history with the snapshot?"), _("Import snapshot"), style=wx.YES_NO | wx.ICON_QUESTION)
+        if dlg.ShowModal() == wx.ID_YES:
+            try:
+                n = self.jobs.import_snapshot(path)
+                self.info.SetLabel(_("Imported {n} reports.").format(n=n))
+            except Exception as e:
+                self.info.SetLabel(_("Error: {m}").format(m=e))
         dlg.Destroy()
 
     def _on_close(self, evt=None):
-        if self.worker and self.worker.is_alive():
-            self.worker.join(timeout=2)
+        self.jobs.remove_listener(self)
         self.Destroy()
 
 
@@ -772,6 +2260,9 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 
     def __init__(self):
         super().__init__()
+        self.jobs = ReportJobManager()
+        self.jobs.sampler.start()
+        NVDASettingsDialog.categoryClasses.append(BatteryReportSettingsPanel)
         self._toolsMenuId = wx.NewId()
         gui.mainFrame.sysTrayIcon.toolsMenu.Append(self._toolsMenuId, _("NVDA Battery Report"))
         gui.mainFrame.sysTrayIcon.Bind(wx.EVT_MENU, self.on_tools_menu, id=self._toolsMenuId)
@@ -780,11 +2271,40 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
     def script_showUI(self, gesture):
         self._launch_dialog()
 
+    @script(description=_("Speaks the latest battery health, capacity, cycle count and fade trend."), category=_("NVDA Battery Report"))
+    def script_speakHealth(self, gesture):
+        if self.jobs.summary.get() is None:
+            threading.Thread(target=self._load_and_speak_health, daemon=True).start()
+        else:
+            self._speak_health()
+
+    def _load_and_speak_health(self):
+        try:
+            self.jobs.load()
+        except Exception:
+            pass
+        wx.CallAfter(self._speak_health)
+
+    def _speak_health(self):
+        text = self.jobs.summary.describe()
+        if text:
+            ui.message(text)
+        else:
+            ui.message(_("No battery report yet. Generating one in the background."))
+        if self.jobs.summary.is_stale():
+            self.jobs.generate()
+
     def on_tools_menu(self, event):
         self._launch_dialog()
 
     def _launch_dialog(self):
-        dlg = BatteryReportDialog(wx.GetApp().GetTopWindow())
+        dlg = BatteryReportDialog(wx.GetApp().GetTopWindow(), self.jobs)
         dlg.Show(); dlg.Raise(); wx.CallAfter(dlg.btn_generate.SetFocus)
 
+    def terminate(self):
+        self.jobs.close()
+        if BatteryReportSettingsPanel in NVDASettingsDialog.categoryClasses:
+            NVDASettingsDialog.categoryClasses.remove(BatteryReportSettingsPanel)
+        super().terminate()
+
     # no default gesture; user sets it in Input gestures
@@ -0,0 +1,36 @@
+import builtins
+import os
+import sys
+import types
+
+ADDON_PLUGINS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "addon", "globalPlugins")
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    sys.modules[name] = mod
+    return mod
+
+
+class _Conf(dict):
+    spec = {}
+
+
+class _Dummy:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+builtins._ = lambda s: s
+_module("wx", Dialog=_Dummy, CallAfter=lambda f, *a, **k: f(*a, **k), NOT_FOUND=-1)
+_module("ui", message=lambda text: None)
+_module("config", conf=_Conf(batteryReport={"summaryMaxAgeHours": 24, "sampleIntervalSeconds": 10}))
+_module("addonHandler", initTranslation=lambda: None)
+_module("globalPluginHandler", GlobalPlugin=_Dummy)
+_module("scriptHandler", script=lambda **kw: (lambda f: f))
+_module("gui.guiHelper")
+_module("gui.nvdaControls")
+_module("gui.settingsDialogs", SettingsPanel=_Dummy, NVDASettingsDialog=type("NVDASettingsDialog", (), {"categoryClasses": []}))
+_module("gui", mainFrame=None, guiHelper=sys.modules["gui.guiHelper"], nvdaControls=sys.modules["gui.nvdaControls"], settingsDialogs=sys.modules["gui.settingsDialogs"])
+sys.path.insert(0, ADDON_PLUGINS)
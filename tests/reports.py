@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+import batteryreport as br
+
+
+def make_info(day, serial="SN1"):
+    start = datetime(2024, 1, 1) + timedelta(days=day)
+    stamp = start.strftime("%Y-%m-%d %H:%M:%S")
+    return {
+        "header": {"Computer name": "LAPTOP-1", "Report time": stamp},
+        "installed": {"Name": "BAT0", "Serial number": serial, "Design capacity": "50,000 mWh", "Full charge capacity": "40,000 mWh", "Cycle count": str(day)},
+        "batteries": [{"installed": {"Serial number": serial}, "design_mWh": 50000, "full_mWh": 40000, "health_pct": 80.0}],
+        "design_mWh": 50000,
+        "full_mWh": 40000 - day,
+        "health_pct": 80.0,
+        "recent_usage": [["START TIME", "STATE", "SOURCE", "CAPACITY REMAINING"], [stamp, "Active", "Battery", "90 %", "36,000 mWh"]],
+        "battery_usage": [["START TIME", "STATE", "DURATION", "ENERGY DRAINED"], [stamp, "Active", "0:30:00", "10 %", "4,000 mWh"]],
+        "usage_history": [["PERIOD", "ACTIVE", "CONNECTED STANDBY"], ["2024-01-01 - 2024-01-08", "1:00:00", "-"]],
+        "capacity_history": [["PERIOD", "FULL CHARGE CAPACITY", "DESIGN CAPACITY"], ["2024-01-01 - 2024-01-08", "40,000 mWh", "50,000 mWh"]],
+        "life_estimates": [],
+    }
+
+
+def make_items(n):
+    items = []
+    for day in range(n):
+        info = make_info(day)
+        items.insert(0, {"summary": br.format_summary(info), "path": f"C:\\reports\\{day}.html", "info": info})
+    return items
+
+
+def make_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(br, "HISTORY_FILE", str(tmp_path / "h.json"))
+    monkeypatch.setattr(br, "SNAPSHOT_FILE", str(tmp_path / "h.bin"))
+    monkeypatch.setattr(br, "SUMMARY_FILE", str(tmp_path / "s.json"))
+    monkeypatch.setattr(br, "_default_sampler_backend", lambda: None)
+    return br.ReportJobManager()
@@ -0,0 +1,23 @@
+import batteryreport as br
+from reports import make_info, make_manager
+
+
+def test_evicted_reports_leave_the_indexes(tmp_path, monkeypatch):
+    monkeypatch.setattr(br, "HISTORY_LIMIT", 3)
+    jobs = make_manager(tmp_path, monkeypatch)
+    for day in range(5):
+        jobs.add_report("", make_info(day))
+    items = jobs.items
+    assert len(items) == 3
+    assert len(jobs.drain_index) == 3
+    assert {s.start.day for s in jobs.drain_index.sessions()} == {3, 4, 5}
+    assert jobs.previous_report(items[-1]) is None
+    assert jobs.previous_report(items[0]) is items[1]["info"]
+
+
+def test_previous_report_matches_the_battery_serial(tmp_path, monkeypatch):
+    jobs = make_manager(tmp_path, monkeypatch)
+    jobs.add_report("", make_info(0))
+    jobs.add_report("", make_info(1, serial="OTHER"))
+    latest = jobs.add_report("", make_info(2))
+    assert jobs.previous_report(latest)["header"]["Report time"].startswith("2024-01-01")
@@ -0,0 +1,70 @@
+import os
+import re
+
+import pytest
+
+import batteryreport as br
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "synthetic-battery-report-en.html")
+
+
+@pytest.fixture
+def html():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+def _localize(html, lang):
+    for key, text in br._HEADING_TEXTS["en"].items():
+        html = html.replace(f">{text}<", f">{br._HEADING_TEXTS[lang][key]}<")
+    labels = br._LABEL_TEXTS[lang]
+    return re.sub(r">([A-Z][A-Za-z ]*)<", lambda m: f">{labels.get(m.group(1).upper(), m.group(1))}<", html)
+
+
+def _second_battery(html, design, full):
+    html = html.replace(">BAT0</td>", ">BAT0</td><td>BAT1</td>")
+    html = html.replace(">50,000 mWh</td></tr>\n<tr><td><span class=\"label\">FULL", f">50,000 mWh</td><td>{design}</td></tr>\n<tr><td><span class=\"label\">FULL")
+    return html.replace(">40,000 mWh</td></tr>\n<tr><td><span class=\"label\">CYCLE", f">40,000 mWh</td><td>{full}</td></tr>\n<tr><td><span class=\"label\">CYCLE")
+
+
+def test_parse_english_report(html):
+    info = br.parse_battery_report(html)
+    assert info["header"]["Computer name"] == "LAPTOP-1"
+    assert info["installed"]["Serial number"] == "SN123"
+    assert (info["design_mWh"], info["full_mWh"], info["health_pct"]) == (50000, 40000, 80.0)
+    assert len(info["recent_usage"]) == 5
+    assert info["battery_usage"][1][:3] == ["2024-01-20 08:00:00", "Active", "0:30:00"]
+    assert len(info["capacity_history"]) == 3
+    assert len(br._drain_sessions(info)) == 2
+
+
+def test_heading_without_table_does_not_take_the_next_one(html):
+    html = html.replace("<h2>Recent usage</h2>", "<h2>Stray</h2>\n<div>no table</div>\n<p>text</p>\n<h2>Recent usage</h2>")
+    assert len(br.parse_battery_report(html)["recent_usage"]) == 5
+
+
+@pytest.mark.parametrize("lang", ["pt_BR", "es", "fr", "it"])
+def test_localized_labels_map_to_canonical_rows(html, lang):
+    english = br.parse_battery_report(html)
+    info = br.parse_battery_report(_localize(html, lang))
+    assert info["header"] == english["header"]
+    assert info["installed"] == english["installed"]
+    assert info["health_pct"] == 80.0
+    for key in ("recent_usage", "battery_usage", "usage_history", "capacity_history", "life_estimates"):
+        assert len(info[key]) == len(english[key])
+        assert info[key][0] == english[key][0]
+    info["battery_usage"] = []
+    assert [s.secs for s in br._drain_sessions(info)] == [1800, 1800, 7200]
+
+
+def test_multiple_batteries_are_summed(html):
+    info = br.parse_battery_report(_second_battery(html, "20,000 mWh", "19,000 mWh"))
+    assert [b["health_pct"] for b in info["batteries"]] == [80.0, 95.0]
+    assert (info["design_mWh"], info["full_mWh"], info["health_pct"]) == (70000, 59000, 84.29)
+
+
+def test_incomplete_second_battery_leaves_total_unknown(html):
+    info = br.parse_battery_report(_second_battery(html, "20,000 mWh", "-"))
+    assert info["batteries"][0]["health_pct"] == 80.0
+    assert (info["design_mWh"], info["full_mWh"], info["health_pct"]) == (None, None, None)
+    assert "Health" not in br.format_summary(info)
@@ -0,0 +1,88 @@
+import math
+
+import batteryreport as br
+
+
+def _battery(root, name, **attrs):
+    bat = root / name
+    bat.mkdir()
+    for attr, value in attrs.items():
+        (bat / attr).write_text(f"{value}\n")
+
+
+def _sysfs(tmp_path):
+    _battery(tmp_path, "AC", type="Mains", online=1)
+    _battery(
+        tmp_path, "BAT0", type="Battery", status="Discharging", capacity=50,
+        energy_full_design=50000000, energy_full=40000000, energy_now=20000000, power_now=8000000,
+        model_name="DELL 1", manufacturer="ACME", serial_number="SN1", technology="Li-ion", cycle_count=123,
+    )
+    return br.SysfsPowerSupplyBackend(str(tmp_path))
+
+
+def test_sysfs_backend_reads_only_batteries(tmp_path):
+    backend = _sysfs(tmp_path)
+    assert backend.batteries() == ["BAT0"]
+    assert backend.read() == (50.0, 8000.0, "Discharging")
+    desc = backend.describe()[0]
+    assert desc["Design capacity"] == "50,000 mWh"
+    assert desc["Full charge capacity"] == "40,000 mWh"
+    assert desc["Serial number"] == "SN1"
+    assert desc["Cycle count"] == "123"
+
+
+def test_sysfs_backend_charge_counters(tmp_path):
+    _battery(tmp_path, "BAT1", type="Battery", status="Charging", capacity=70,
+        charge_full=4000000, charge_now=2000000, voltage_min_design=10000000, current_now=-1500000, voltage_now=12000000)
+    charge, power, state = br.SysfsPowerSupplyBackend(str(tmp_path)).read()
+    assert (charge, power, state) == (50.0, 18000.0, "Charging")
+
+
+def test_sysfs_backend_missing_root(tmp_path):
+    backend = br.SysfsPowerSupplyBackend(str(tmp_path / "missing"))
+    assert not backend.available()
+    assert backend.read() == (None, None, "Unknown")
+
+
+def test_sample_ring_wraps_around():
+    ring = br.SampleRing(3)
+    for i in range(5):
+        ring.append(float(i), i * 10.0, None, "Charging" if i % 2 else "Bogus")
+    samples = ring.samples()
+    assert len(ring) == 3
+    assert [s[0] for s in samples] == [2.0, 3.0, 4.0]
+    assert [s[3] for s in samples] == ["Unknown", "Charging", "Unknown"]
+    assert math.isnan(samples[0][2])
+    assert ring.latest()[0] == 4.0
+
+
+def test_live_sampler_sample_once(tmp_path):
+    sampler = br.LiveSampler(_sysfs(tmp_path), interval=1)
+    ts, charge, power, state = sampler.sample_once()
+    assert (charge, power, state) == (50.0, 8000.0, "Discharging")
+    assert len(sampler.ring) == 1
+
+
+def test_live_sampler_to_info(tmp_path):
+    sampler = br.LiveSampler(_sysfs(tmp_path), interval=1)
+    t0 = 1705737600.0
+    sampler.ring.append(t0, 50.0, 8000.0, "Discharging")
+    sampler.ring.append(t0 + 1800, 40.0, 8000.0, "Discharging")
+    sampler.ring.append(t0 + 1900, 41.0, 9000.0, "Charging")
+    info = sampler.to_info()
+    assert (info["design_mWh"], info["full_mWh"], info["health_pct"]) == (50000, 40000, 80.0)
+    assert info["installed"]["Serial number"] == "SN1"
+    assert [r[2:4] for r in info["recent_usage"][1:]] == [["Battery", "50 %"], ["AC", "41 %"]]
+    usage = info["battery_usage"][1]
+    assert usage[2:] == ["0:30:00", "10 %", "4,000 mWh"]
+    session = br._drain_sessions(info)[0]
+    assert (session.secs, session.drained_mWh, session.mw) == (1800, 4000, 8000)
+
+
+def test_live_sampler_interval_from_config():
+    assert br.LiveSampler(backend=False).interval is None
+    br.config.conf["batteryReport"]["sampleIntervalSeconds"] = 30
+    try:
+        assert br._sampler_interval() == 30
+    finally:
+        br.config.conf["batteryReport"]["sampleIntervalSeconds"] = 10
@@ -0,0 +1,76 @@
+import batteryreport as br
+from reports import make_info, make_items, make_manager
+
+
+def test_indexes_keep_snapshot_items_lazy(tmp_path):
+    path = str(tmp_path / "h.bin")
+    br.write_history_snapshot(make_items(5), path)
+    with br.ColumnarSnapshot(path) as snap:
+        items = snap.items()
+        br.DrainIndex(it.get("info", {}) for it in reversed(items))
+        index = br.HistoryIndex(items, rows=False)
+        assert index.previous_report(items[0]) is items[1]
+        for item in items:
+            info = item["info"]
+            assert info and len(info) == 11
+            assert {"usage_history", "capacity_history", "life_estimates"} <= info._pending
+
+
+def test_snapshot_round_trip(tmp_path):
+    items = make_items(3)
+    items[1]["pinned"] = True
+    items[2]["info"]["life_estimates"] = [["PERIOD", "ACTIVE"], ["2024-01-01 - 2024-01-08", "5:00:00", "—", "ação"]]
+    items[2]["info"]["health_pct"] = None
+    items[2]["info"]["design_mWh"] = None
+    path = str(tmp_path / "h.bin")
+    br.write_history_snapshot(items, path)
+    assert br.read_history_snapshot(path) == items
+    with br.ColumnarSnapshot(path) as snap:
+        assert len(snap) == 3
+        assert snap.table_rows("battery_usage", 1) == items[1]["info"]["battery_usage"]
+        lazy = snap.items()
+        assert lazy[1]["pinned"] is True
+        assert lazy[2]["info"]["life_estimates"] == items[2]["info"]["life_estimates"]
+        assert dict(lazy[0]["info"]) == items[0]["info"]
+
+
+def test_snapshot_rejects_truncated_files(tmp_path):
+    path = tmp_path / "h.bin"
+    br.write_history_snapshot(make_items(2), str(path))
+    data = path.read_bytes()
+    for cut in (3, 40, len(data) // 2):
+        path.write_bytes(data[:cut])
+        try:
+            br.ColumnarSnapshot(str(path))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"truncated at {cut} bytes was accepted")
+
+
+def test_writes_keep_an_exported_snapshot_current(tmp_path, monkeypatch):
+    br._save_json(str(tmp_path / "h.json"), make_items(3))
+    jobs = make_manager(tmp_path, monkeypatch)
+    jobs.export_snapshot(br.SNAPSHOT_FILE)
+    jobs.close()
+
+    jobs = make_manager(tmp_path, monkeypatch)
+    assert len(jobs.items) == 3 and jobs._snapshot is not None
+    jobs.add_report("", make_info(10))
+    jobs.close()
+
+    items, snap = br._load_history()
+    assert snap is not None
+    assert [it["info"]["header"]["Report time"][:10] for it in items] == ["2024-01-11", "2024-01-03", "2024-01-02", "2024-01-01"]
+    snap.close()
+
+
+def test_close_releases_the_snapshot(tmp_path, monkeypatch):
+    br.write_history_snapshot(make_items(2), str(tmp_path / "h.bin"))
+    jobs = make_manager(tmp_path, monkeypatch)
+    assert len(jobs.items) == 2
+    snap = jobs._snapshot
+    jobs.close()
+    assert snap._buf is None and snap._file.closed
+    assert len(jobs.items) == 2
+    jobs.close()
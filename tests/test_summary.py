@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta
+
+import batteryreport as br
+from reports import make_info, make_items, make_manager
+
+
+def _plugin(jobs, monkeypatch):
+    spoken = []
+    monkeypatch.setattr(br.ui, "message", spoken.append)
+    plugin = br.GlobalPlugin.__new__(br.GlobalPlugin)
+    plugin.jobs = jobs
+    generated = []
+    monkeypatch.setattr(jobs, "generate", lambda requester=None: generated.append(requester))
+    return plugin, spoken, generated
+
+
+def test_speak_health_seeds_the_cache_from_stored_reports(tmp_path, monkeypatch):
+    items = make_items(4)
+    items[0]["info"]["header"]["Report time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    br._save_json(str(tmp_path / "h.json"), items)
+    jobs = make_manager(tmp_path, monkeypatch)
+    plugin, spoken, generated = _plugin(jobs, monkeypatch)
+    assert jobs.summary.get() is None
+    plugin._load_and_speak_health()
+    assert spoken and spoken[0].startswith("Battery health 80.0%")
+    assert generated == []
+    assert br._load_json(str(tmp_path / "s.json"), None)["health_pct"] == 80.0
+
+
+def test_speak_health_without_history_generates(tmp_path, monkeypatch):
+    jobs = make_manager(tmp_path, monkeypatch)
+    plugin, spoken, generated = _plugin(jobs, monkeypatch)
+    plugin._load_and_speak_health()
+    assert spoken == ["No battery report yet. Generating one in the background."]
+    assert generated == [None]
+
+
+def test_staleness_follows_report_time(tmp_path):
+    cache = br.SummaryCache(str(tmp_path / "s.json"), max_age=3600)
+    info = make_info(0)
+    info["header"]["Report time"] = (datetime.now() - timedelta(minutes=30)).strftime("%Y-%m-%d %H:%M:%S")
+    cache.update(info)
+    assert "updated" not in cache.get()
+    assert not cache.is_stale()
+    info["header"]["Report time"] = (datetime.now() - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M:%S")
+    cache.update(info)
+    assert cache.is_stale()
+    assert not br.SummaryCache(str(tmp_path / "s.json"), max_age=0).is_stale()